@@ -0,0 +1,249 @@
+"""
+WebSense-AI Form Filling Chain — Deferred Checkpointer
+
+Wraps a checkpointer (SqliteSaver or MemorySaver) so that intermediate super-step
+checkpoints are buffered instead of persisted.  The form filling flow
+only needs the final state of a turn to resume the next one, so the
+buffer is flushed once per turn (after the graph reaches END) rather
+than on every node transition.
+
+The chain runs in a long-lived worker, so stored state is also bounded:
+each flush replaces the thread's previous checkpoint instead of adding
+to its history, and threads that stay idle (sessions that ended by
+closing the tab) are deleted after idle_ttl seconds or once more than
+max_threads are stored.
+
+Usage:
+    checkpointer = DeferredCheckpointSaver()
+    graph.compile(checkpointer=checkpointer)
+    graph.invoke(state, config)
+    checkpointer.flush(session_id)
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Iterator, Optional, Sequence
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+)
+from langgraph.checkpoint.memory import MemorySaver
+
+
+class DeferredCheckpointSaver(BaseCheckpointSaver):
+    """
+    Checkpointer that buffers put / put_writes and forwards only the
+    latest checkpoint of a thread to the inner saver on flush().
+
+    Reads (get_tuple, list) always go to the inner saver, so they see
+    the state as of the last completed turn.
+
+    Attributes:
+        inner: The saver that actually persists checkpoints.
+        max_threads: Most threads kept; the least recently flushed go
+            first.  None for no limit.
+        idle_ttl: Seconds after its last flush a thread is deleted.
+            None to keep idle threads.
+    """
+
+    def __init__(
+        self,
+        inner: Optional[BaseCheckpointSaver] = None,
+        max_threads: Optional[int] = None,
+        idle_ttl: Optional[float] = None,
+    ) -> None:
+        self.inner = inner if inner is not None else MemorySaver()
+        super().__init__(serde=self.inner.serde)
+        self.max_threads = max_threads
+        self.idle_ttl = idle_ttl
+        # thread_id → {"config", "checkpoint", "metadata", "new_versions", "writes"}
+        self._pending: dict[str, dict[str, Any]] = {}
+        # thread_id → monotonic time of its last flush, oldest first
+        self._last_flush: OrderedDict[str, float] = OrderedDict()
+        self._lock = threading.Lock()
+
+    # ── Buffered writes ──
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """Buffer a checkpoint instead of persisting it."""
+        configurable = config["configurable"]
+        thread_id = configurable["thread_id"]
+        checkpoint_ns = configurable.get("checkpoint_ns", "")
+
+        with self._lock:
+            entry = self._pending.get(thread_id)
+            if entry is None:
+                # Keep the first config of the turn — its checkpoint_id is
+                # the parent of everything buffered after it.
+                entry = {"config": config, "new_versions": {}}
+                self._pending[thread_id] = entry
+            entry["checkpoint"] = checkpoint
+            entry["metadata"] = metadata
+            # Channels changed in earlier steps must still be written on flush
+            entry["new_versions"].update(new_versions)
+            entry["writes"] = []
+
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """Buffer pending writes for the latest buffered checkpoint."""
+        thread_id = config["configurable"]["thread_id"]
+        with self._lock:
+            entry = self._pending.get(thread_id)
+            if entry is None or "checkpoint" not in entry:
+                self.inner.put_writes(config, writes, task_id, task_path)
+                return
+            entry["writes"].append((config, list(writes), task_id, task_path))
+
+    def flush(self, thread_id: str) -> None:
+        """
+        Persists the latest buffered checkpoint for a thread.
+
+        Called once at the end of a turn, after the graph has reached END.
+        The thread's earlier checkpoints are dropped: only the latest is
+        ever read back, and they would otherwise pile up (full page_fields
+        and conversation_history each) for the life of the worker.  Threads
+        left idle past idle_ttl / beyond max_threads are deleted too.
+        """
+        with self._lock:
+            entry = self._pending.pop(thread_id, None)
+        if not entry or "checkpoint" not in entry:
+            return
+
+        checkpoint = entry["checkpoint"]
+        configurable = entry["config"]["configurable"]
+        # Replace, rather than append to, the stored history.  The new
+        # checkpoint becomes the thread's root, and every channel is
+        # written again since the blobs of unchanged channels go with
+        # the old checkpoints (MemorySaver stores them separately).
+        self.inner.delete_thread(thread_id)
+        saved_config = self.inner.put(
+            {"configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": configurable.get("checkpoint_ns", ""),
+            }},
+            checkpoint,
+            entry["metadata"],
+            dict(checkpoint["channel_versions"]),
+        )
+        checkpoint_id = checkpoint["id"]
+        for config, writes, task_id, task_path in entry["writes"]:
+            if config["configurable"].get("checkpoint_id") == checkpoint_id:
+                self.inner.put_writes(saved_config, writes, task_id, task_path)
+
+        for stale_thread in self._touch(thread_id):
+            self.inner.delete_thread(stale_thread)
+
+    def _touch(self, thread_id: str) -> list[str]:
+        """Marks a thread as just flushed; returns the threads to evict."""
+        now = time.monotonic()
+        with self._lock:
+            self._last_flush[thread_id] = now
+            self._last_flush.move_to_end(thread_id)
+            evicted = []
+            for other, flushed_at in self._last_flush.items():
+                over_limit = (
+                    self.max_threads is not None
+                    and len(self._last_flush) - len(evicted) > self.max_threads
+                )
+                expired = self.idle_ttl is not None and now - flushed_at > self.idle_ttl
+                if other == thread_id or not (over_limit or expired):
+                    break
+                evicted.append(other)
+            for other in evicted:
+                del self._last_flush[other]
+                self._pending.pop(other, None)
+        return evicted
+
+    def discard(self, thread_id: str) -> None:
+        """Drops buffered checkpoints for a thread (e.g. after a failed turn)."""
+        with self._lock:
+            self._pending.pop(thread_id, None)
+
+    # ── Reads / maintenance delegate to the inner saver ──
+
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        return self.inner.get_tuple(config)
+
+    def list(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[CheckpointTuple]:
+        return self.inner.list(config, filter=filter, before=before, limit=limit)
+
+    def delete_thread(self, thread_id: str) -> None:
+        self.discard(thread_id)
+        with self._lock:
+            self._last_flush.pop(thread_id, None)
+        self.inner.delete_thread(thread_id)
+
+    def get_next_version(self, current: Any, channel: Any) -> Any:
+        return self.inner.get_next_version(current, channel)
+
+    # ── Async variants (used by compiled_graph.ainvoke) ──
+    # Buffering is in-memory and inner reads are local (in-process dict or
+    # SQLite), so these simply run the sync methods — this also lets sync-
+    # only savers such as SqliteSaver back an async graph.
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        return self.put(config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        self.put_writes(config, writes, task_id, task_path)
+
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        return self.get_tuple(config)
+
+    async def alist(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        for item in self.list(config, filter=filter, before=before, limit=limit):
+            yield item
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        self.delete_thread(thread_id)
@@ -2,8 +2,10 @@
 WebSense-AI Form Filling Chain — Graph Assembly
 
 Assembles the LangGraph pipeline with router-based orchestration
-and 9 nodes.  Compiles with MemorySaver for multi-turn
-conversation persistence.
+and 9 nodes.  Compiles with a DeferredCheckpointSaver (buffering
+wrapper around SqliteSaver, or MemorySaver if the SQLite checkpointer
+is not installed) for multi-turn conversation persistence — only the
+final state of each turn is checkpointed.
 
 Graph Flow:
     START → router → [conditional edges]:
@@ -13,7 +15,7 @@ Graph Flow:
     "correction"    → correction_handler → [review → END | END]
     "spell_command" → spell_readout → END
 
-Conversation Phases (persisted across turns via MemorySaver):
+Conversation Phases (persisted across turns via the checkpointer):
     idle           — waiting for user input
     confirming     — extracted fields shown, awaiting yes/no
     correcting     — user said no, bot asks which field
@@ -21,12 +23,18 @@ Conversation Phases (persisted across turns via MemorySaver):
     spell_confirm  — confirming the new spelling
 """
 
+import os
+import asyncio
+import sqlite3
+import threading
+from functools import lru_cache
 from typing import Literal, Optional
 
 from langgraph.graph import StateGraph, END
-from langgraph.checkpoint.memory import MemorySaver
+from langgraph.checkpoint.base import BaseCheckpointSaver
 
 from .state import WebSenseState
+from .checkpointer import DeferredCheckpointSaver
 from .nodes import (
     router_node,
     intake_node,
@@ -63,10 +71,14 @@ def correction_decision(state: WebSenseState) -> str:
 # GRAPH CONSTRUCTION
 # ============================================================
 
+@lru_cache(maxsize=1)
 def build_form_filling_graph() -> StateGraph:
     """
     Constructs the router-based form filling LangGraph.
 
+    Memoized — repeated calls (tests, reloads) return the same graph
+    instead of re-adding every node and conditional edge.
+
     Nodes:
         0. router              — Decide route based on conversation_phase
         1. intake              — Sanitize transcript, detect sensitive data
@@ -79,7 +91,7 @@ def build_form_filling_graph() -> StateGraph:
         8. spell_readout       — Handle "spell <field>" command
 
     Returns:
-        Compiled StateGraph ready for invocation with MemorySaver.
+        Uncompiled StateGraph; see get_compiled_graph().
     """
     graph = StateGraph(WebSenseState)
 
@@ -142,20 +154,87 @@ def build_form_filling_graph() -> StateGraph:
     return graph
 
 
+@lru_cache(maxsize=4)
+def get_compiled_graph(checkpointer: BaseCheckpointSaver):
+    """
+    Compiles the form filling graph against a checkpointer.
+
+    Cached per checkpointer instance so graph validation and Pregel
+    construction only run once per process.
+    """
+    return build_form_filling_graph().compile(checkpointer=checkpointer)
+
+
 # ============================================================
 # COMPILED GRAPH WITH MEMORY
 # ============================================================
 
-checkpointer = MemorySaver()
+def _build_checkpointer() -> DeferredCheckpointSaver:
+    """
+    Creates the session checkpointer.
+
+    Uses SqliteSaver (in-memory by default, or the file named by
+    WEBSENSE_CHECKPOINT_DB in WAL mode) so sessions can be deleted
+    explicitly; falls back to MemorySaver if langgraph-checkpoint-sqlite
+    is not installed.  Sessions idle for WEBSENSE_SESSION_TTL seconds, or
+    beyond the WEBSENSE_MAX_SESSIONS most recent, are evicted.
+    """
+    limits = {
+        "max_threads": int(os.environ.get("WEBSENSE_MAX_SESSIONS", "1000")),
+        "idle_ttl": float(os.environ.get("WEBSENSE_SESSION_TTL", "3600")),
+    }
+    try:
+        from langgraph.checkpoint.sqlite import SqliteSaver
+    except ImportError:
+        return DeferredCheckpointSaver(**limits)
+
+    db_path = os.environ.get("WEBSENSE_CHECKPOINT_DB", ":memory:")
+    conn = sqlite3.connect(db_path, check_same_thread=False)
+    if db_path != ":memory:":
+        conn.execute("PRAGMA journal_mode=WAL")
+    return DeferredCheckpointSaver(SqliteSaver(conn), **limits)
+
+
+# Intermediate super-step checkpoints are buffered; invoke_form_filling
+# flushes the final one after the graph reaches END.
+checkpointer = _build_checkpointer()
 workflow = build_form_filling_graph()
-compiled_graph = workflow.compile(checkpointer=checkpointer)
+compiled_graph = get_compiled_graph(checkpointer)
 
 
 # ============================================================
 # INVOCATION INTERFACE
 # ============================================================
 
-def invoke_form_filling(
+@lru_cache(maxsize=1024)
+def _session_config(session_id: str) -> dict:
+    """
+    Returns the LangGraph run config for a session, reused across turns.
+
+    Treat the returned dict as read-only — it is shared.
+    """
+    return {"configurable": {"thread_id": session_id}}
+
+
+def _state_snapshot(state: dict) -> dict:
+    """
+    Returns the conversational fields of a state that the frontend
+    persists and sends back as resume_state on the next turn.
+    """
+    return {
+        "conversation_phase": state.get("conversation_phase", "idle"),
+        "extracted_fields": state.get("extracted_fields", {}),
+        "matched_selectors": state.get("matched_selectors", {}),
+        "confidence_scores": state.get("confidence_scores", {}),
+        "missing_fields": state.get("missing_fields", []),
+        "conversation_history": state.get("conversation_history", []),
+        "turn_count": state.get("turn_count", 0),
+        "correcting_field_key": state.get("correcting_field_key", ""),
+        "spelling_buffer": state.get("spelling_buffer", ""),
+    }
+
+
+async def ainvoke_form_filling(
     transcript: str,
     page_fields: list[dict],
     session_id: str,
@@ -165,6 +244,9 @@ def invoke_form_filling(
     """
     Invokes the form filling chain with multi-turn memory persistence.
 
+    Async entry point — extract_node awaits the LLM, so several sessions
+    can be in flight on one event loop.
+
     The router reads the persisted conversation_phase to decide the
     route.  On a new session the phase defaults to "idle" which routes
     to the extraction pipeline.  On subsequent turns (confirming,
@@ -184,36 +266,30 @@ def invoke_form_filling(
     try:
         restored_state = resume_state.copy() if isinstance(resume_state, dict) else {}
 
+        # conversation_history is append-only (operator.add reducer): when
+        # the checkpointer already holds this session, re-sending the
+        # restored history would duplicate it.
+        if "conversation_history" in restored_state and get_session_state(session_id):
+            del restored_state["conversation_history"]
+
         # Merge restored conversational state with current turn input
-        initial_state: WebSenseState = {
-            **restored_state,
-            "raw_transcript": transcript,
-            "page_fields": page_fields,
-            "session_id": session_id,
-            "user_id": user_id,
-        }
+        # (restored_state is already a private copy — update it in place)
+        initial_state: WebSenseState = restored_state
+        initial_state.update(
+            raw_transcript=transcript,
+            page_fields=page_fields,
+            session_id=session_id,
+            user_id=user_id,
+        )
 
-        config = {
-            "configurable": {
-                "thread_id": session_id,
-            }
-        }
+        config = _session_config(session_id)
 
-        final_state = compiled_graph.invoke(initial_state, config)
+        final_state = await compiled_graph.ainvoke(initial_state, config)
+        checkpointer.flush(session_id)
 
         # Return structured bot_response + state snapshot for persistence
         bot_response = final_state.get("bot_response")
-        state_snapshot = {
-            "conversation_phase": final_state.get("conversation_phase", "idle"),
-            "extracted_fields": final_state.get("extracted_fields", {}),
-            "matched_selectors": final_state.get("matched_selectors", {}),
-            "confidence_scores": final_state.get("confidence_scores", {}),
-            "missing_fields": final_state.get("missing_fields", []),
-            "conversation_history": final_state.get("conversation_history", []),
-            "turn_count": final_state.get("turn_count", 0),
-            "correcting_field_key": final_state.get("correcting_field_key", ""),
-            "spelling_buffer": final_state.get("spelling_buffer", ""),
-        }
+        state_snapshot = _state_snapshot(final_state)
 
         if bot_response:
             return {
@@ -232,6 +308,7 @@ def invoke_form_filling(
         }
 
     except Exception as e:
+        checkpointer.discard(session_id)
         return {
             "bot_response": {
                 "action": "error",
@@ -242,15 +319,76 @@ def invoke_form_filling(
         }
 
 
+def invoke_form_filling(
+    transcript: str,
+    page_fields: list[dict],
+    session_id: str,
+    user_id: str = "default_user",
+    resume_state: Optional[dict] = None,
+) -> dict:
+    """
+    Synchronous wrapper around ainvoke_form_filling() for callers
+    without an event loop (e.g. invoke_chain.py).
+
+    Every call runs on the same private event loop, so the LLM client and
+    its connection pool (bound to the loop, see nodes._get_llm) stay
+    usable across turns of a long-lived worker.  asyncio.run() would
+    close the loop after each turn.
+
+    Args / Returns: see ainvoke_form_filling().
+    """
+    with _sync_loop_lock:
+        return _get_sync_loop().run_until_complete(ainvoke_form_filling(
+            transcript=transcript,
+            page_fields=page_fields,
+            session_id=session_id,
+            user_id=user_id,
+            resume_state=resume_state,
+        ))
+
+
+_sync_loop: Optional[asyncio.AbstractEventLoop] = None
+_sync_loop_lock = threading.Lock()
+
+
+def _get_sync_loop() -> asyncio.AbstractEventLoop:
+    """Returns the event loop invoke_form_filling() runs on (call with the lock held)."""
+    global _sync_loop
+    if _sync_loop is None or _sync_loop.is_closed():
+        _sync_loop = asyncio.new_event_loop()
+    return _sync_loop
+
+
+def get_session_state(session_id: str) -> dict:
+    """
+    Returns the persisted channel values for a session.
+
+    Reads the checkpoint straight from the checkpointer with get_tuple()
+    instead of compiled_graph.get_state(), which bypasses the Pregel
+    snapshot construction and pending-writes merge — the bulk of
+    get_state()'s cost.
+
+    Args:
+        session_id: Session ID (LangGraph thread_id).
+
+    Returns:
+        Dict of state values as of the last completed turn, or {} if
+        the session has no checkpoint.
+    """
+    checkpoint_tuple = checkpointer.get_tuple(_session_config(session_id))
+    if checkpoint_tuple is None:
+        return {}
+    return checkpoint_tuple.checkpoint.get("channel_values", {})
+
+
 def clear_session(session_id: str) -> None:
     """
     Clears conversation memory for a session.
 
-    MemorySaver is in-process; memory clears on restart.
-    For production, swap to SqliteSaver / RedisSaver and implement
-    explicit deletion.
+    Deletes every checkpoint and pending write stored for the thread,
+    plus anything still buffered for it.
     """
-    pass
+    checkpointer.delete_thread(session_id)
 
 
 # ============================================================
@@ -260,5 +398,7 @@ def clear_session(session_id: str) -> None:
 __all__ = [
     "compiled_graph",
     "invoke_form_filling",
+    "ainvoke_form_filling",
+    "get_session_state",
     "clear_session",
 ]
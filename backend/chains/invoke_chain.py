@@ -3,95 +3,266 @@
 WebSense-AI Form Filling Chain Invocation Script
 
 Called by Node.js backend to execute the LangGraph form filling chain.
-Receives JSON payload via command-line argument, invokes the chain,
-and outputs JSON result to stdout.
+
+Runs in one of two modes:
+  - One-shot: receives a JSON payload via command-line argument, invokes
+    the chain, outputs the JSON result to stdout and exits.
+  - Worker: with no argument, stays alive and reads newline-delimited
+    JSON payloads from stdin, writing one JSON result line per request.
+    Requests run concurrently, so responses may come back out of order;
+    each response echoes its request's "id".  The Node.js backend keeps
+    a single worker running so interpreter start-up and LangGraph
+    import / compile cost is paid once.
+
+A payload with "op": "clear_session" deletes the session's checkpoints
+instead of running a turn (answered with {"action": "session_cleared"}).
 
 Usage:
     python invoke_chain.py '{"transcript": "...", "page_fields": [...], ...}'
+    python invoke_chain.py '{"op": "clear_session", "session_id": "..."}'
+    python invoke_chain.py < requests.ndjson
 """
 
 import sys
 import json
 import os
-from typing import Dict, Any
+import asyncio
+import weakref
+from typing import Dict, Any, Optional
+
+# orjson decodes large page_fields payloads several times faster than
+# stdlib json; stdlib is the fallback.  orjson.JSONDecodeError subclasses
+# json.JSONDecodeError, so the error handling below covers both.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+
+def _load_json(payload_json: str) -> Any:
+    """Parses the JSON payload received from Node.js."""
+    if orjson is not None:
+        return orjson.loads(payload_json)
+    return json.loads(payload_json)
+
+
+def _write_json(obj: Dict[str, Any]) -> None:
+    """Writes a JSON response line to stdout for Node.js to parse."""
+    if orjson is not None:
+        sys.stdout.buffer.write(orjson.dumps(obj) + b"\n")
+        sys.stdout.buffer.flush()
+    else:
+        print(json.dumps(obj), flush=True)
+
+
 try:
-    from chains.graph import invoke_form_filling
+    from chains.graph import invoke_form_filling, ainvoke_form_filling, clear_session
 except ImportError as e:
     error_response = {
         "action": "error",
         "message": f"Failed to import chain modules: {str(e)}",
     }
-    print(json.dumps(error_response))
+    _write_json(error_response)
     sys.exit(1)
 
 
-def main() -> None:
+def _validate_request(payload: Any) -> Optional[Dict[str, Any]]:
+    """Returns an error response if the payload is not a usable request."""
+    if not isinstance(payload, dict):
+        return {
+            "action": "error",
+            "message": "Invalid JSON payload: expected an object",
+        }
+    if payload.get("op") == "clear_session":
+        return None
+
+    # Validate required fields
+    if not payload.get("transcript") or not payload.get("session_id"):
+        return {
+            "action": "error",
+            "message": "Missing required fields: transcript and session_id",
+        }
+    return None
+
+
+def _turn_kwargs(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Extracts the invoke_form_filling() arguments from a turn payload."""
+    return {
+        "transcript": payload["transcript"],
+        "page_fields": payload.get("page_fields", []),
+        "session_id": payload["session_id"],
+        "user_id": payload.get("user_id", "default_user"),
+        "resume_state": payload.get("resume_state", {}),
+    }
+
+
+def handle_request(payload: Any) -> Dict[str, Any]:
     """
-    Main entry point for chain invocation.
-    Reads JSON from command-line arg, invokes chain, outputs result.
+    Validates one request payload and invokes the chain.
+
+    Args:
+        payload: Decoded JSON payload from Node.js.
+
+    Returns:
+        The chain result, or an error response dict.
     """
-    try:
-        # Read JSON payload from command-line argument
-        if len(sys.argv) < 2:
-            error_response = {
-                "action": "error",
-                "message": "Missing JSON payload argument",
-            }
-            print(json.dumps(error_response))
-            sys.exit(1)
-
-        payload_json = sys.argv[1]
-        payload = json.loads(payload_json)
-
-        # Extract required fields
-        transcript = payload.get("transcript", "")
-        page_fields = payload.get("page_fields", [])
-        session_id = payload.get("session_id", "")
-        user_id = payload.get("user_id", "default_user")
-        resume_state = payload.get("resume_state", {})
-
-        # Validate required fields
-        if not transcript or not session_id:
-            error_response = {
-                "action": "error",
-                "message": "Missing required fields: transcript and session_id",
-            }
-            print(json.dumps(error_response))
-            sys.exit(1)
+    error = _validate_request(payload)
+    if error is not None:
+        return error
+    if payload.get("op") == "clear_session":
+        return handle_clear_session(payload)
 
+    try:
         # Invoke the LangGraph chain — returns a BotResponse dict
-        result = invoke_form_filling(
-            transcript=transcript,
-            page_fields=page_fields,
-            session_id=session_id,
-            user_id=user_id,
-            resume_state=resume_state,
-        )
-
-        # Output result as JSON to stdout
-        print(json.dumps(result))
-        sys.exit(0)
-
-    except json.JSONDecodeError as e:
-        error_response = {
+        return invoke_form_filling(**_turn_kwargs(payload))
+    except Exception as e:
+        return {
             "action": "error",
-            "message": f"Invalid JSON payload: {str(e)}",
+            "message": f"Chain execution failed: {str(e)}",
         }
-        print(json.dumps(error_response))
-        sys.exit(1)
 
+
+async def ahandle_request(payload: Any) -> Dict[str, Any]:
+    """Async handle_request() for the worker's event loop."""
+    error = _validate_request(payload)
+    if error is not None:
+        return error
+    if payload.get("op") == "clear_session":
+        return handle_clear_session(payload)
+
+    try:
+        return await ainvoke_form_filling(**_turn_kwargs(payload))
     except Exception as e:
-        error_response = {
+        return {
             "action": "error",
             "message": f"Chain execution failed: {str(e)}",
         }
-        print(json.dumps(error_response))
+
+
+def handle_clear_session(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Deletes a session's checkpoints, so a reused session_id starts over.
+
+    Args:
+        payload: {"op": "clear_session", "session_id": "..."}.
+
+    Returns:
+        {"action": "session_cleared", ...}, or an error response dict.
+    """
+    session_id = payload.get("session_id", "")
+    if not session_id:
+        return {
+            "action": "error",
+            "message": "Missing required field: session_id",
+        }
+
+    try:
+        clear_session(session_id)
+    except Exception as e:
+        return {
+            "action": "error",
+            "message": f"Failed to clear session: {str(e)}",
+        }
+    return {"action": "session_cleared", "session_id": session_id}
+
+
+async def _serve_request(
+    payload: Any,
+    session_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]",
+) -> None:
+    """Runs one worker request and writes its response, tagged with its id."""
+    request_id = payload.get("id") if isinstance(payload, dict) else None
+    session_id = payload.get("session_id") if isinstance(payload, dict) else None
+
+    if isinstance(session_id, str) and session_id:
+        # Turns of one session share its checkpoint, so they run one at
+        # a time; different sessions run concurrently.
+        lock = session_locks.get(session_id)
+        if lock is None:
+            lock = session_locks[session_id] = asyncio.Lock()
+        async with lock:
+            result = await ahandle_request(payload)
+    else:
+        result = await ahandle_request(payload)
+
+    if request_id is not None:
+        result = {**result, "id": request_id}
+    _write_json(result)
+
+
+async def _aserve() -> None:
+    """Reads requests until stdin closes, running each as its own task."""
+    loop = asyncio.get_running_loop()
+    session_locks: weakref.WeakValueDictionary[str, asyncio.Lock] = weakref.WeakValueDictionary()
+    tasks: set[asyncio.Task] = set()
+
+    while True:
+        # readline() blocks, so it runs off the loop; a pipe reader
+        # (connect_read_pipe) would not work on Windows.
+        line = await loop.run_in_executor(None, sys.stdin.buffer.readline)
+        if not line:
+            break
+        if not line.strip():
+            continue
+        try:
+            payload = _load_json(line)
+        except json.JSONDecodeError as e:
+            _write_json({
+                "action": "error",
+                "message": f"Invalid JSON payload: {str(e)}",
+            })
+            continue
+        task = loop.create_task(_serve_request(payload, session_locks))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
+    if tasks:
+        await asyncio.gather(*tasks)
+
+
+def serve() -> None:
+    """
+    Worker loop: one JSON request per stdin line, one JSON response per
+    stdout line.  Exits when stdin is closed and in-flight requests are
+    answered.
+
+    Requests run concurrently on one event loop that lives as long as
+    the worker, so a slow LLM call for one user does not hold up the
+    others, and the cached LLM client stays usable across requests.
+    Responses are written in completion order and carry the request's
+    "id".  Sessions outlive a turn until a clear_session op deletes them.
+    """
+    asyncio.run(_aserve())
+
+
+def main() -> None:
+    """
+    Main entry point for chain invocation.
+    Reads JSON from command-line arg, invokes chain, outputs result.
+    Without an argument, runs as a long-lived stdin worker.
+    """
+    if len(sys.argv) < 2:
+        serve()
+        sys.exit(0)
+
+    try:
+        payload = _load_json(sys.argv[1])
+    except json.JSONDecodeError as e:
+        _write_json({
+            "action": "error",
+            "message": f"Invalid JSON payload: {str(e)}",
+        })
         sys.exit(1)
 
+    result = handle_request(payload)
+
+    # Output result as JSON to stdout
+    _write_json(result)
+    sys.exit(1 if result.get("action") == "error" else 0)
+
 
 if __name__ == "__main__":
     main()
@@ -17,15 +17,42 @@ Nodes:
 """
 
 import re
+import sys
 import json
 import uuid
-from typing import Any
+import asyncio
+import hashlib
+import threading
+import weakref
+from functools import lru_cache
+from typing import Any, NamedTuple, Optional, TypedDict
 
 from langchain_cohere import ChatCohere
 from langchain_core.messages import SystemMessage, HumanMessage
 
 from .state import WebSenseState
 
+# orjson serializes the LLM prompt context and parses LLM responses
+# several times faster than stdlib json, which is the fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# RE2 (google-re2) gives linear-time DFA matching for the sensitive-data
+# scan that runs on every transcript; the stdlib engine is the fallback.
+try:
+    import re2 as _scan_re
+except ImportError:
+    _scan_re = re
+
+# Hyperscan compiles all sensitive patterns into one SIMD-accelerated
+# automaton; preferred over RE2 for the scan when installed.
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
 
 # ============================================================
 # CONSTANTS
@@ -40,6 +67,42 @@ SENSITIVE_PATTERNS = {
     "CVV": re.compile(r"\bcvv\s+is\s+\d{3,4}\b", re.IGNORECASE),
 }
 
+# All SENSITIVE_PATTERNS fused into one alternation — a single scan tells
+# whether a transcript needs redacting at all.  Case-insensitivity is set
+# inline because RE2 does not take stdlib re flags.
+_SENSITIVE_FUSED = "(?i)" + "|".join(
+    f"(?P<{k}>{v.pattern})" for k, v in SENSITIVE_PATTERNS.items()
+)
+_SENSITIVE_RE = re.compile(_SENSITIVE_FUSED)
+
+
+def _compile_sensitive_scanner():
+    """
+    Builds the fast prefilter for ASCII transcripts: a Hyperscan database
+    if available, else the fused pattern on the RE2 engine, else None.
+    """
+    if hyperscan is not None:
+        try:
+            db = hyperscan.Database()
+            db.compile(
+                expressions=[p.pattern.encode() for p in SENSITIVE_PATTERNS.values()],
+                ids=list(range(len(SENSITIVE_PATTERNS))),
+                elements=len(SENSITIVE_PATTERNS),
+                flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH]
+                * len(SENSITIVE_PATTERNS),
+            )
+            return db
+        except hyperscan.HyperscanError:
+            pass
+    if _scan_re is not re:
+        return _scan_re.compile(_SENSITIVE_FUSED)
+    return None
+
+
+_SENSITIVE_SCANNER = _compile_sensitive_scanner()
+# Hyperscan pattern id → SENSITIVE_PATTERNS category
+_SENSITIVE_CATEGORIES: tuple[str, ...] = tuple(SENSITIVE_PATTERNS)
+
 CORRECTION_KEYWORDS = [
     "wait", "change", "update", "actually",
     "no", "wrong", "fix", "correct",
@@ -115,6 +178,66 @@ FIELD_SELECTORS: dict[str, list[str]] = {
     ],
 }
 
+# Reverse index: lowercased id / name attribute value appearing in
+# FIELD_SELECTORS → field type (e.g. "addresscity" → "city").  Built once
+# so the selector fallback is a single dict probe per extracted field.
+_SELECTOR_TOKEN_RE = re.compile(r"^#([\w-]+)$|^\[name='([^']+)'\]$")
+
+
+def _build_selector_index() -> dict[str, str]:
+    index: dict[str, str] = {}
+    for field_type, selectors in FIELD_SELECTORS.items():
+        for selector in selectors:
+            token_match = _SELECTOR_TOKEN_RE.match(selector)
+            if token_match:
+                token = (token_match.group(1) or token_match.group(2)).lower()
+                index.setdefault(token, field_type)
+    return index
+
+
+_SELECTOR_INDEX: dict[str, str] = _build_selector_index()
+
+# Forms with at least this many DOM fields get a _TrigramIndex for the
+# fuzzy matching pass; below it a plain scan is cheaper than the build
+_TRIGRAM_MIN_FIELDS = 32
+
+# Field name patterns used by _normalize_field_name and _fields_match
+_CAMEL_RE = re.compile(r"([a-z])([A-Z])")
+_SPLIT_RE = re.compile(r"[_\-\s]+")
+
+# Separator → space table for _pretty
+_PRETTY_TRANS = str.maketrans({"_": " ", "-": " "})
+
+# Attributes probed by the generic wildcard selectors in match_selectors_node
+_GENERIC_SELECTOR_ATTRS = ("name", "id", "placeholder", "aria-label", "autocomplete")
+
+# autocomplete attribute value → extracted field names it stands for
+_AUTOCOMPLETE_FIELD_NAMES: dict[str, frozenset[str]] = {
+    "given-name": frozenset({"first_name", "firstname", "fname", "first"}),
+    "family-name": frozenset({"last_name", "lastname", "lname", "last", "surname"}),
+    "name": frozenset({"name", "fullname", "full_name"}),
+    "email": frozenset({"email", "emailaddress", "email_address"}),
+    "tel": frozenset({"phone", "phonenumber", "phone_number", "telephone", "tel", "mobile"}),
+    "street-address": frozenset({"address", "streetaddress", "street_address", "address1"}),
+    "address-level2": frozenset({"city", "addresscity"}),
+    "address-level1": frozenset({"state", "province", "addressstate"}),
+    "postal-code": frozenset({"zip", "zipcode", "zip_code", "postalcode", "postal_code"}),
+    "country-name": frozenset({"country", "addresscountry"}),
+    "organization": frozenset({"company", "organization", "org"}),
+    "username": frozenset({"username", "user", "login"}),
+}
+
+# Reverse index: extracted field name → autocomplete values it satisfies
+def _build_autocomplete_index() -> dict[str, tuple[str, ...]]:
+    index: dict[str, tuple[str, ...]] = {}
+    for auto_val, field_names in _AUTOCOMPLETE_FIELD_NAMES.items():
+        for field_name in field_names:
+            index[field_name] = index.get(field_name, ()) + (auto_val,)
+    return index
+
+
+_AUTOCOMPLETE_BY_FIELD_NAME: dict[str, tuple[str, ...]] = _build_autocomplete_index()
+
 # System prompt for the extract node LLM call
 EXTRACT_SYSTEM_PROMPT = """You are a form-filling assistant for WebSense-AI.
 Your job is to extract form field values from the user's voice transcript.
@@ -201,10 +324,48 @@ Return ONLY valid JSON:
 """
 
 
+# ============================================================
+# LLM CLIENT
+# ============================================================
+
+# event loop → {(model, temperature): ChatCohere}.  The client's async
+# HTTP pool is bound to the loop it first ran on, so clients are shared
+# per loop; entries go away with their loop.
+_llm_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict]" = weakref.WeakKeyDictionary()
+_llm_clients_lock = threading.Lock()
+
+
+def _get_llm(model: str, temperature: float) -> ChatCohere:
+    """
+    Returns a shared ChatCohere client per (model, temperature) for the
+    running event loop.
+
+    Reusing the client keeps its HTTP connection pool alive across turns
+    instead of re-reading auth and re-handshaking on every call.  A client
+    created under an earlier (since closed) loop is never handed out —
+    its pool would fail with "Event loop is closed".
+    """
+    loop = asyncio.get_running_loop()
+    with _llm_clients_lock:
+        clients = _llm_clients.setdefault(loop, {})
+        llm = clients.get((model, temperature))
+        if llm is None:
+            llm = clients[(model, temperature)] = ChatCohere(model=model, temperature=temperature)
+    return llm
+
+
 # ============================================================
 # NODE 1: INTAKE
 # ============================================================
 
+# session_id → (sha256 of raw transcript, sanitized, contains_sensitive).
+# Clarification round-trips often resend the same transcript; only a
+# digest is kept so no raw (unredacted) text is retained in memory.
+_INTAKE_CACHE_MAX_SESSIONS = 1024
+_last_intake: dict[str, tuple[bytes, str, bool]] = {}
+_last_intake_lock = threading.Lock()
+
+
 def intake_node(state: WebSenseState) -> dict[str, Any]:
     """
     Receives raw transcript and page fields.
@@ -219,10 +380,9 @@ def intake_node(state: WebSenseState) -> dict[str, Any]:
 
     Returns:
         Dict of state updates: sanitized_transcript, contains_sensitive,
-        turn_count, conversation_history, session_id.
+        turn_count, conversation_history (new entry only), session_id.
     """
     raw_transcript: str = state.get("raw_transcript", "")
-    conversation_history: list[dict] = state.get("conversation_history", [])
     turn_count: int = state.get("turn_count", 0)
     session_id: str = state.get("session_id", "")
 
@@ -230,29 +390,33 @@ def intake_node(state: WebSenseState) -> dict[str, Any]:
     if not session_id:
         session_id = str(uuid.uuid4())
 
-    # Detect and redact sensitive data
-    contains_sensitive = False
-    sanitized = raw_transcript
-
-    for data_type, pattern in SENSITIVE_PATTERNS.items():
-        if pattern.search(sanitized):
-            contains_sensitive = True
-            sanitized = pattern.sub(f"[{data_type}_REDACTED]", sanitized)
-
-    # Update conversation history with this turn
+    # Detect and redact sensitive data (skipped when the session resends
+    # the transcript it sent last turn)
+    digest = hashlib.sha256(raw_transcript.encode()).digest()
+    with _last_intake_lock:
+        cached = _last_intake.get(session_id)
+    if cached and cached[0] == digest:
+        sanitized, contains_sensitive = cached[1], cached[2]
+    else:
+        sanitized, contains_sensitive = _redact_sensitive(raw_transcript)
+        with _last_intake_lock:
+            _last_intake.pop(session_id, None)
+            if len(_last_intake) >= _INTAKE_CACHE_MAX_SESSIONS:
+                del _last_intake[next(iter(_last_intake))]
+            _last_intake[session_id] = (digest, sanitized, contains_sensitive)
+
+    # Append this turn to conversation history (reducer concatenates)
     turn_count += 1
-    conversation_history = conversation_history.copy()
-    conversation_history.append({
-        "turn": turn_count,
-        "role": "user",
-        "content": sanitized,  # Only store sanitized version
-    })
 
     return {
         "sanitized_transcript": sanitized,
         "contains_sensitive": contains_sensitive,
         "turn_count": turn_count,
-        "conversation_history": conversation_history,
+        "conversation_history": [{
+            "turn": turn_count,
+            "role": "user",
+            "content": sanitized,  # Only store sanitized version
+        }],
         "session_id": session_id,
     }
 
@@ -261,11 +425,14 @@ def intake_node(state: WebSenseState) -> dict[str, Any]:
 # NODE 2: EXTRACT
 # ============================================================
 
-def extract_node(state: WebSenseState) -> dict[str, Any]:
+async def extract_node(state: WebSenseState) -> dict[str, Any]:
     """
     Uses Cohere (command-a-03-2025) to extract form field values
     from the sanitized transcript. NEVER receives raw transcript.
 
+    Async so the LLM round-trip awaits on the event loop instead of
+    blocking a worker thread (graph must be run with ainvoke).
+
     Includes page_fields context so the LLM knows which fields exist
     on the page, and full conversation_history for multi-turn memory.
 
@@ -277,7 +444,7 @@ def extract_node(state: WebSenseState) -> dict[str, Any]:
 
     Returns:
         Dict of state updates: extracted_fields, missing_fields,
-        conversation_history.
+        conversation_history (new entry only).
     """
     sanitized_transcript: str = state.get("sanitized_transcript", "")
     page_fields: list[dict] = state.get("page_fields", [])
@@ -300,75 +467,59 @@ def extract_node(state: WebSenseState) -> dict[str, Any]:
         if matched_quick:
             merged_fields = {**existing_fields, **matched_quick}
 
-            conversation_history = conversation_history.copy()
-            conversation_history.append({
-                "turn": state.get("turn_count", 1),
-                "role": "assistant",
-                "content": f"Fast-extracted: {list(matched_quick.keys())}",
-            })
-
             return {
                 "extracted_fields": merged_fields,
                 "missing_fields": [f.get("name", "") or f.get("id", "") for f in page_fields if (f.get("name", "") or f.get("id", "")) not in merged_fields],
-                "conversation_history": conversation_history,
+                "conversation_history": [{
+                    "turn": state.get("turn_count", 1),
+                    "role": "assistant",
+                    "content": f"Fast-extracted: {list(matched_quick.keys())}",
+                }],
                 "extraction_method": "regex",
                 "error_message": "",
             }
         # If regex keys don't match page fields, fall through to LLM
 
-    # Build field context for the LLM — give it full page field details
-    # Emphasize the label/meaning to help semantic matching
-    field_descriptions = []
-    for f in page_fields:
-        field_id = f.get("id", "")
-        field_name = f.get("name", "")
-        label = f.get("label", "") or f.get("placeholder", "") or f.get("ariaLabel", "")
-        desc = {
-            "key_to_use": field_name or field_id,  # This is what the LLM should use as extraction key
-            "label_meaning": label,  # This tells the LLM what the field is FOR
-            "name": field_name,
-            "id": field_id,
-            "type": f.get("type", "text"),
-            "placeholder": f.get("placeholder", ""),
-            "label": f.get("label", ""),
-            "autocomplete": f.get("autocomplete", ""),
-            "isRequired": f.get("isRequired", False),
-        }
-        field_descriptions.append(desc)
-
-    field_context = (
-        f"Page fields below. IMPORTANT: Use the 'key_to_use' value (name or id) as the "
-        f"JSON key, but match user data to the field based on 'label_meaning' "
-        f"(e.g. if label_meaning is 'First Name' and user says 'my first name is X', "
-        f"map X to that field's key_to_use):\n"
-        f"{json.dumps(field_descriptions, indent=2)}"
-    )
+    # Build field context for the LLM (cached across turns on the same page)
+    field_context = _field_context(page_fields)
 
     # Build conversation context
-    history_text = ""
-    for entry in conversation_history:
-        role = entry.get("role", "user")
-        content = entry.get("content", "")
-        history_text += f"{role}: {content}\n"
+    history_text = "".join(
+        f"{entry.get('role', 'user')}: {entry.get('content', '')}\n"
+        for entry in conversation_history
+    )
 
     # Construct the user message
     user_message = (
         f"Conversation so far:\n{history_text}\n\n"
         f"{field_context}\n\n"
         f"Latest user input: {sanitized_transcript}\n\n"
-        f"Already extracted fields: {json.dumps(existing_fields)}\n\n"
+        f"Already extracted fields: {_dumps_compact(existing_fields)}\n\n"
         f"Extract all form field values from the conversation. "
         f"Merge with already extracted fields."
     )
 
     try:
-        llm = ChatCohere(model="command-a-03-2025", temperature=0)
-        response = llm.invoke([
+        llm = _get_llm("command-a-03-2025", 0)
+
+        # Stream the response and stop reading as soon as the top-level
+        # JSON object closes — trailing fences / chatter are never awaited.
+        chunks: list[str] = []
+        tracker = _JsonObjectTracker()
+        stream = llm.astream([
             SystemMessage(content=EXTRACT_SYSTEM_PROMPT),
             HumanMessage(content=user_message),
         ])
+        try:
+            async for chunk in stream:
+                text = chunk.content if isinstance(chunk.content, str) else ""
+                chunks.append(text)
+                if tracker.feed(text):
+                    break
+        finally:
+            await stream.aclose()
 
-        response_text = response.content.strip()
+        response_text = "".join(chunks).strip()
 
         # Try to parse JSON from response
         parsed = _parse_llm_json(response_text)
@@ -379,18 +530,15 @@ def extract_node(state: WebSenseState) -> dict[str, Any]:
         # Merge with existing fields (preserve previous turns)
         merged_fields = {**existing_fields, **extracted}
 
-        # Update conversation history with assistant response
-        conversation_history = conversation_history.copy()
-        conversation_history.append({
-            "turn": state.get("turn_count", 1),
-            "role": "assistant",
-            "content": f"Extracted: {list(extracted.keys())}",
-        })
-
         return {
             "extracted_fields": merged_fields,
             "missing_fields": missing,
-            "conversation_history": conversation_history,
+            # Assistant response for this turn (reducer appends it)
+            "conversation_history": [{
+                "turn": state.get("turn_count", 1),
+                "role": "assistant",
+                "content": f"Extracted: {list(extracted.keys())}",
+            }],
             "extraction_method": "cohere_llm",
             "error_message": "",
         }
@@ -419,7 +567,11 @@ def match_selectors_node(state: WebSenseState) -> dict[str, Any]:
     Strategy (in priority order):
     1. Match extracted field name/id against actual page_fields from DOM scan.
        Use the page field's own reliable selector (computed by content.js).
-    2. Try predefined selectors from FIELD_SELECTORS as fallback.
+       Exact id / name / autocomplete hits come from an index; label /
+       substring matches (_view_matches) are added to them, on long forms
+       only for the fields a _TrigramIndex can't rule out.
+    2. Try predefined selectors from FIELD_SELECTORS as fallback (directly
+       by normalized name, or via the _SELECTOR_INDEX reverse index).
     3. Generate generic fallback selectors using wildcards.
 
     Args:
@@ -434,52 +586,93 @@ def match_selectors_node(state: WebSenseState) -> dict[str, Any]:
     matched_selectors: dict[str, list[str]] = {}
     confidence_scores: dict[str, float] = {}
 
+    if not extracted_fields:
+        return {"matched_selectors": matched_selectors, "confidence_scores": confidence_scores}
+
+    # No DOM scan yet — every field goes straight to the fallbacks
+    if not page_fields:
+        for field_name, field_data in extracted_fields.items():
+            matched_selectors[field_name] = list(
+                _fallback_selectors(field_name, _normalize_field_name(field_name))
+            )
+            confidence_scores[field_name] = field_data.get("confidence", 0.5)
+        return {"matched_selectors": matched_selectors, "confidence_scores": confidence_scores}
+
+    # Lowercased views for fuzzy matching, plus lowercased id / name and
+    # autocomplete value → indices into page_fields
+    page_views = _precompute_dom_fields(page_fields)
+    by_key: dict[str, list[int]] = {}
+    by_autocomplete: dict[str, list[int]] = {}
+    for i, view in enumerate(page_views):
+        for key in {view["id_l"], view["name_l"]}:
+            if key:
+                by_key.setdefault(key, []).append(i)
+        if view["auto_l"]:
+            by_autocomplete.setdefault(view["auto_l"], []).append(i)
+
+    # Built on the first fuzzy lookup, and only for long forms
+    trigram_index: Optional[_TrigramIndex] = None
+
     for field_name, field_data in extracted_fields.items():
-        selectors: list[str] = []
         normalized_name = _normalize_field_name(field_name)
 
-        # 1. PRIMARY — Match against actual page fields from DOM scan
-        for page_field in page_fields:
+        # 1. PRIMARY — Match against actual page fields from DOM scan.
+        #    Exact id / name / autocomplete hits come from the index; the
+        #    label / substring matches of _view_matches are added to them
+        #    (a hidden #email input must not hide the field labelled
+        #    "Email").  The scan skips fields already hit, and on long
+        #    forms the ones the trigram index rules out.
+        raw_lower = field_name.lower().strip()
+        hits: set[int] = set()
+        for key in (raw_lower, normalized_name):
+            hits.update(by_key.get(key, ()))
+        for key in (raw_lower, normalized_name):
+            for auto_val in _AUTOCOMPLETE_BY_FIELD_NAME.get(key, ()):
+                hits.update(by_autocomplete.get(auto_val, ()))
+
+        terms = _field_terms(field_name, normalized_name)
+        candidate_ids: Any = range(len(page_views))
+        if len(page_views) >= _TRIGRAM_MIN_FIELDS:
+            if trigram_index is None:
+                trigram_index = _TrigramIndex.build(page_views)
+            ids = trigram_index.candidates(terms)
+            if ids is not None:
+                candidate_ids = ids
+        matched_ids = hits.union(
+            i for i in candidate_ids if i not in hits and _view_matches(terms, page_views[i])
+        )
+        matches = [page_fields[i] for i in sorted(matched_ids)]
+
+        # Page selectors go in front (latest match first, as with the old
+        # insert(0, …)); id / name selectors follow as backups.  `seen`
+        # keeps the dedup checks O(1).
+        primary: list[str] = []
+        backups: list[str] = []
+        seen: set[str] = set()
+        for page_field in matches:
             page_id = page_field.get("id", "")
             page_name_attr = page_field.get("name", "")
-            page_placeholder = page_field.get("placeholder", "")
-            page_label = page_field.get("label", "")
-            page_autocomplete = page_field.get("autocomplete", "")
             page_selector = page_field.get("selector", "")
-            page_aria = page_field.get("ariaLabel", "")
 
-            # Check if this DOM field matches our extracted field
-            if _fields_match(
-                field_name, normalized_name,
-                page_id, page_name_attr, page_placeholder,
-                page_label, page_autocomplete, page_aria,
+            # Use the page field's own computed selector FIRST (most reliable)
+            if page_selector and page_selector not in seen:
+                seen.add(page_selector)
+                primary.append(page_selector)
+            # Also add id and name selectors as backups
+            for backup in (
+                f"#{page_id}" if page_id else "",
+                f"[name='{page_name_attr}']" if page_name_attr else "",
             ):
-                # Use the page field's own computed selector FIRST (most reliable)
-                if page_selector and page_selector not in selectors:
-                    selectors.insert(0, page_selector)
-                # Also add id and name selectors as backups
-                if page_id and f"#{page_id}" not in selectors:
-                    selectors.append(f"#{page_id}")
-                if page_name_attr:
-                    name_sel = f"[name='{page_name_attr}']"
-                    if name_sel not in selectors:
-                        selectors.append(name_sel)
-
-        # 2. FALLBACK — Add predefined selectors only if no page match found
-        if not selectors and normalized_name in FIELD_SELECTORS:
-            selectors.extend(FIELD_SELECTORS[normalized_name])
-
-        # 3. GENERIC FALLBACK — wildcard selectors
+                if backup and backup not in seen:
+                    seen.add(backup)
+                    backups.append(backup)
+        primary.reverse()
+        selectors = primary + backups
+
+        # 2./3. FALLBACK — predefined, then generic selectors, only if
+        #       no page match was found
         if not selectors:
-            # Try with the raw field name and normalized variants
-            for variant in {field_name, normalized_name, normalized_name.replace("_", "")}:
-                selectors.extend([
-                    f"[name*='{variant}' i]",
-                    f"[id*='{variant}' i]",
-                    f"[placeholder*='{variant}' i]",
-                    f"[aria-label*='{variant}' i]",
-                    f"[autocomplete*='{variant}' i]",
-                ])
+            selectors = list(_fallback_selectors(field_name, normalized_name))
 
         matched_selectors[field_name] = selectors
         confidence_scores[field_name] = field_data.get("confidence", 0.5)
@@ -490,6 +683,38 @@ def match_selectors_node(state: WebSenseState) -> dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=1024)
+def _fallback_selectors(field_name: str, normalized_name: str) -> tuple[str, ...]:
+    """
+    Selectors for a field with no page_fields match (steps 2 and 3 of
+    match_selectors_node).  Depends only on the names, so it is memoized;
+    callers copy the tuple into a list for the state.
+    """
+    # 2. FALLBACK — predefined selectors.  Names that are not a
+    #    FIELD_SELECTORS key themselves (e.g. "addressCity") resolve
+    #    through the selector reverse index.
+    field_type = (
+        normalized_name if normalized_name in FIELD_SELECTORS
+        else _SELECTOR_INDEX.get(field_name.lower())
+    )
+    if field_type:
+        return tuple(FIELD_SELECTORS[field_type])
+
+    # 3. GENERIC FALLBACK — wildcard selectors for the raw field name and
+    #    normalized variants.  The selectors match case-insensitively, so
+    #    variants differing only in case (e.g. "favColor" / "favcolor")
+    #    are emitted once.
+    variants: dict[str, str] = {}
+    for variant in (field_name, normalized_name, normalized_name.replace("_", "")):
+        if variant:
+            variants.setdefault(variant.lower(), variant)
+    return tuple(
+        f"[{attr}*='{variant}' i]"
+        for variant in variants.values()
+        for attr in _GENERIC_SELECTOR_ATTRS
+    )
+
+
 # ============================================================
 # ORCHESTRATION CONSTANTS
 # ============================================================
@@ -514,6 +739,15 @@ CANCEL_WORDS = frozenset([
 ])
 
 
+# Phases whose route does not depend on the user's input
+_PHASE_ROUTES: dict[str, str] = {
+    "idle": "extract",
+    "correcting": "correction",
+    "spelling": "correction",
+    "spell_confirm": "correction",
+}
+
+
 def _is_yes(text: str) -> bool:
     lower = text.lower().strip()
     return lower in YES_WORDS or any(w in lower.split() for w in ("yes", "yeah", "yep", "sure", "ok", "okay", "confirm", "proceed"))
@@ -548,7 +782,7 @@ def _pretty(name: str, label_map: dict[str, str]) -> str:
     """Return human-readable label for a field name/id."""
     if name in label_map and label_map[name] != name:
         return label_map[name]
-    return re.sub(r'[_\-]+', ' ', name).strip().title()
+    return " ".join(name.translate(_PRETTY_TRANS).split()).title()
 
 
 def _build_summary_html(extracted_fields: dict, label_map: dict) -> str:
@@ -580,26 +814,17 @@ def router_node(state: WebSenseState) -> dict[str, Any]:
     if spell_match and phase in ("idle", "confirming"):
         return {"next_route": "spell_command"}
 
-    if phase == "idle":
-        return {"next_route": "extract"}
-
-    elif phase == "confirming":
-        if _is_yes(lower):
-            return {"next_route": "confirm"}
-        elif _is_no(lower):
+    if phase == "confirming":
+        if _is_yes(lower) or _is_no(lower):
             return {"next_route": "confirm"}
-        else:
-            # Treat as new input to extract and merge
-            return {
-                "next_route": "extract",
-                "conversation_phase": "idle",
-            }
-
-    elif phase in ("correcting", "spelling", "spell_confirm"):
-        return {"next_route": "correction"}
+        # Treat as new input to extract and merge
+        return {
+            "next_route": "extract",
+            "conversation_phase": "idle",
+        }
 
-    # Fallback
-    return {"next_route": "extract"}
+    # Every other phase routes unconditionally (unknown → extract)
+    return {"next_route": _PHASE_ROUTES.get(phase, "extract")}
 
 
 # ============================================================
@@ -619,15 +844,18 @@ def review_node(state: WebSenseState) -> dict[str, Any]:
 
     label_map = _build_label_map(page_fields)
 
-    # Build pretty summary
+    # Build pretty summary (each label is prettified once and reused for
+    # the HTML rows and fields_summary)
     summary_lines = []
     summary_dict = {}
+    fields_summary = {}
     for field_name, field_data in extracted_fields.items():
         value = field_data.get("value", "") if isinstance(field_data, dict) else field_data
         if value:
             pretty = _pretty(field_name, label_map)
             summary_lines.append(f"• <b>{pretty}</b>: {value}")
             summary_dict[field_name] = value
+            fields_summary[pretty] = value
 
     field_count = len(summary_dict)
 
@@ -647,8 +875,8 @@ def review_node(state: WebSenseState) -> dict[str, Any]:
 
     # Build missing fields info
     missing_html = ""
-    if missing_fields:
-        pretty_missing = [_pretty(f, label_map) for f in missing_fields]
+    pretty_missing = [_pretty(f, label_map) for f in missing_fields]
+    if pretty_missing:
         missing_html = f"<br><br>📝 Still need: <b>{', '.join(pretty_missing)}</b>"
 
     message = (
@@ -667,9 +895,9 @@ def review_node(state: WebSenseState) -> dict[str, Any]:
         "bot_response": {
             "action": "confirm_fill",
             "message": message,
-            "fields_summary": {_pretty(k, label_map): v for k, v in summary_dict.items()},
+            "fields_summary": fields_summary,
             "summary": summary_dict,
-            "missing_fields": [_pretty(f, label_map) for f in missing_fields],
+            "missing_fields": pretty_missing,
             "extraction_method": extraction_method,
             "speak_text": speak,
             "status_text": "Waiting for confirmation…",
@@ -735,7 +963,8 @@ def confirm_handler_node(state: WebSenseState) -> dict[str, Any]:
 def correction_handler_node(state: WebSenseState) -> dict[str, Any]:
     """
     Handles the full correction flow across sub-phases:
-     - correcting: identify which field user wants to fix
+     - correcting: identify which field user wants to fix, or apply new
+       values for several fields at once ("email is … and phone is …")
      - spelling: collect letters or whole-word replacement
      - spell_confirm: confirm the new spelling, apply or retry
     """
@@ -750,6 +979,33 @@ def correction_handler_node(state: WebSenseState) -> dict[str, Any]:
 
     # ── SUB-PHASE: correcting (identify which field) ──
     if phase == "correcting":
+        # Bulk path: "email is x@y.com and phone is 0300 1234567" corrects
+        # every mentioned field in one turn instead of one spelling loop each.
+        corrections = _bulk_corrections(user_input, extracted_fields)
+        if corrections:
+            updated_fields = dict(extracted_fields)
+            for key, new_value in corrections.items():
+                fd = updated_fields.get(key)
+                updated_fields[key] = {
+                    **(fd if isinstance(fd, dict) else {}),
+                    "value": new_value,
+                    "confidence": 0.95,
+                    "source_text": f"Correction: {new_value}",
+                }
+            updated_names = ", ".join(f"<b>{_pretty(k, label_map)}</b>" for k in corrections)
+            return {
+                "extracted_fields": updated_fields,
+                "correcting_field_key": "",
+                "spelling_buffer": "",
+                "correction_route": "review",  # Route back to review for re-confirmation
+                "bot_response": {
+                    "action": "show_fields",
+                    "message": f"✅ Updated {updated_names}!",
+                    "speak_text": f"Updated {len(corrections)} field{'s' if len(corrections) > 1 else ''}.",
+                    "status_text": "Correction applied",
+                },
+            }
+
         matched_field = None
 
         # Try matching user words against field keys and labels
@@ -909,23 +1165,18 @@ def correction_handler_node(state: WebSenseState) -> dict[str, Any]:
         pretty_name = _pretty(correcting_key, label_map)
 
         if _is_yes(lower):
-            # Apply correction
-            updated_fields = {**extracted_fields}
+            # Apply correction — extracted_fields has no reducer, so the
+            # full dict is returned; only the corrected slot is rebuilt.
+            new_value = spelling_buffer.strip()
+            updated_fields = dict(extracted_fields)
             if correcting_key in updated_fields:
                 fd = updated_fields[correcting_key]
-                if isinstance(fd, dict):
-                    updated_fields[correcting_key] = {
-                        **fd,
-                        "value": spelling_buffer.strip(),
-                        "confidence": 0.95,
-                        "source_text": f"Spelling correction: {spelling_buffer.strip()}",
-                    }
-                else:
-                    updated_fields[correcting_key] = {
-                        "value": spelling_buffer.strip(),
-                        "confidence": 0.95,
-                        "source_text": f"Spelling correction: {spelling_buffer.strip()}",
-                    }
+                updated_fields[correcting_key] = {
+                    **(fd if isinstance(fd, dict) else {}),
+                    "value": new_value,
+                    "confidence": 0.95,
+                    "source_text": f"Spelling correction: {new_value}",
+                }
 
             return {
                 "extracted_fields": updated_fields,
@@ -934,8 +1185,8 @@ def correction_handler_node(state: WebSenseState) -> dict[str, Any]:
                 "correction_route": "review",  # Route back to review for re-confirmation
                 "bot_response": {
                     "action": "show_fields",
-                    "message": f"✅ Updated <b>{pretty_name}</b> to <b>{spelling_buffer.strip()}</b>!",
-                    "speak_text": f"Updated {pretty_name} to {spelling_buffer.strip()}.",
+                    "message": f"✅ Updated <b>{pretty_name}</b> to <b>{new_value}</b>!",
+                    "speak_text": f"Updated {pretty_name} to {new_value}.",
                     "status_text": "Correction applied",
                 },
             }
@@ -1107,11 +1358,265 @@ def spell_readout_node(state: WebSenseState) -> dict[str, Any]:
 # HELPER FUNCTIONS
 # ============================================================
 
+class _JsonObjectTracker:
+    """
+    Incrementally tracks brace depth over streamed LLM text to detect
+    when the first top-level JSON object is complete.  Braces inside
+    JSON strings (including escaped quotes) are ignored.
+    """
+
+    def __init__(self) -> None:
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+        self.started = False
+
+    def feed(self, text: str) -> bool:
+        """Consumes the next chunk; returns True once the object has closed."""
+        for ch in text:
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif ch == "\\":
+                    self.escaped = True
+                elif ch == '"':
+                    self.in_string = False
+            elif ch == '"':
+                if self.started:
+                    self.in_string = True
+            elif ch == "{":
+                self.depth += 1
+                self.started = True
+            elif ch == "}" and self.started:
+                self.depth -= 1
+                if self.depth == 0:
+                    return True
+        return False
+
+
+def _dumps_compact(obj: Any) -> str:
+    """
+    Serializes obj as compact JSON (no indentation / spaces) for LLM
+    prompts — fewer bytes and tokens than pretty-printed output.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def _loads_json(text: str) -> Any:
+    """
+    Parses JSON text, via orjson when installed.
+
+    Raises json.JSONDecodeError on invalid input (orjson's error type
+    subclasses it).
+    """
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _field_context(page_fields: list[dict]) -> str:
+    """
+    Returns the page field context block for the extraction prompt.
+
+    The DOM rarely changes between turns of a session, so the rendered
+    block is cached on the field attributes it is built from.
+    """
+    key = tuple(
+        (
+            f.get("id", ""),
+            f.get("name", ""),
+            f.get("label", ""),
+            f.get("placeholder", ""),
+            f.get("ariaLabel", ""),
+            f.get("type", "text"),
+            f.get("autocomplete", ""),
+            f.get("isRequired", False),
+        )
+        for f in page_fields
+    )
+    try:
+        return _build_field_context(key)
+    except TypeError:
+        # Unhashable attribute values — build without caching
+        return _build_field_context.__wrapped__(key)
+
+
+@lru_cache(maxsize=64)
+def _build_field_context(fields: tuple) -> str:
+    """Builds the field context block from _field_context()'s key tuple."""
+    # Give the LLM full page field details and emphasize the label/meaning
+    # to help semantic matching
+    field_descriptions = []
+    for field_id, field_name, label, placeholder, aria_label, field_type, autocomplete, is_required in fields:
+        desc = {
+            "key_to_use": field_name or field_id,  # This is what the LLM should use as extraction key
+            "label_meaning": label or placeholder or aria_label,  # This tells the LLM what the field is FOR
+            "name": field_name,
+            "id": field_id,
+            "type": field_type,
+            "placeholder": placeholder,
+            "label": label,
+            "autocomplete": autocomplete,
+            "isRequired": is_required,
+        }
+        field_descriptions.append(desc)
+
+    return (
+        f"Page fields below. IMPORTANT: Use the 'key_to_use' value (name or id) as the "
+        f"JSON key, but match user data to the field based on 'label_meaning' "
+        f"(e.g. if label_meaning is 'First Name' and user says 'my first name is X', "
+        f"map X to that field's key_to_use):\n"
+        f"{_dumps_compact(field_descriptions)}"
+    )
+
+
+# Regex-extracted fields whose match is itself proof of a real value
+_BULK_VALUE_KEYS = frozenset({"email", "phone"})
+
+
+def _bulk_corrections(user_input: str, extracted_fields: dict) -> dict[str, str]:
+    """
+    Finds new values for already-extracted fields in a correction utterance.
+
+    Uses the regex extractor, so one utterance can correct several fields
+    at once.  Only applies when the utterance clearly carries new values —
+    an email / phone match, or two or more field=value pairs.  A single
+    free-text "X is …" is usually a judgement ("name is not right",
+    "first name is the problem"), so it is left to the normal
+    "which field?" / spelling flow.
+
+    Args:
+        user_input: The user's correction statement.
+        extracted_fields: Current extracted fields (field key → FieldData).
+
+    Returns:
+        Dict of extracted field key → new value (empty if none found).
+    """
+    candidates = _regex_fallback_extract(user_input)
+    # "last name is X" also satisfies the bare "name is X" pattern
+    if "last_name" in candidates:
+        candidates.pop("name", None)
+
+    corrections: dict[str, str] = {}
+    has_contact_value = False
+    for regex_key, data in candidates.items():
+        value = data["value"]
+        if set(value.lower().split()) & NO_WORDS:
+            continue
+        normalized = _normalize_field_name(regex_key)
+        for key in extracted_fields:
+            if key == regex_key or _normalize_field_name(key) == normalized:
+                corrections[key] = value
+                has_contact_value = has_contact_value or regex_key in _BULK_VALUE_KEYS
+                break
+
+    if has_contact_value or len(corrections) >= 2:
+        return corrections
+    return {}
+
+
+def _collect_category(pattern_id: int, _start: int, _end: int, _flags: int, found: set[str]) -> None:
+    """Hyperscan match callback — records the matched category in `found`."""
+    found.add(_SENSITIVE_CATEGORIES[pattern_id])
+
+
+def _sensitive_categories(text: str) -> Optional[set[str]]:
+    """
+    Scans the text for SENSITIVE_PATTERNS categories.
+
+    Returns the set of categories present (empty for clean text) when the
+    Hyperscan database is available — it reports every pattern's matches
+    independently, overlaps included.  The RE2 / stdlib fused pattern can
+    only tell that something matched, so those paths return None for
+    sensitive text, meaning every category must be tried.
+
+    The fast scanners only see printable ASCII text: they match digits,
+    whitespace and word boundaries as ASCII classes, whereas the stdlib
+    patterns used for the actual redaction are Unicode-aware.  Anything
+    else goes through the stdlib fused pattern so the scan can never skip
+    a redaction.
+    """
+    scanner = _SENSITIVE_SCANNER
+    if scanner is None or not (text.isascii() and text.isprintable()):
+        return None if _SENSITIVE_RE.search(text) else set()
+
+    if hyperscan is not None and isinstance(scanner, hyperscan.Database):
+        found: set[str] = set()
+        try:
+            scanner.scan(text.encode(), match_event_handler=_collect_category, context=found)
+        except hyperscan.HyperscanError:
+            # e.g. scratch space busy in another thread
+            return None if _SENSITIVE_RE.search(text) else set()
+        return found
+
+    return None if scanner.search(text) else set()
+
+
+def _redact_sensitive(text: str) -> tuple[str, bool]:
+    """
+    Replaces SENSITIVE_PATTERNS matches with [TYPE_REDACTED] tokens.
+
+    Clean text (the common case) costs one prefilter scan.
+    Text that does match is redacted per category in SENSITIVE_PATTERNS
+    order, so overlapping matches (e.g. a card number spoken after
+    "password is") are still fully redacted.  With Hyperscan, only the
+    categories it found are substituted.
+
+    Args:
+        text: Raw user text.
+
+    Returns:
+        Tuple of (sanitized text, whether anything was redacted).
+    """
+    categories = _sensitive_categories(text)
+    if categories is not None and not categories:
+        return text, False
+
+    for data_type, pattern in SENSITIVE_PATTERNS.items():
+        if categories is None or data_type in categories:
+            text = pattern.sub(f"[{data_type}_REDACTED]", text)
+    return text, True
+
+
+# Pattern for _parse_llm_json
+_JSON_OBJECT_RE = re.compile(r"\{[\s\S]*\}")
+
+# Patterns for _regex_fallback_extract
+_EMAIL_RE = re.compile(r"[\w.+-]+@[\w-]+\.[\w.-]+")
+# Phone pattern (supports US, Pakistani 03xx-xxxxxxx, international +xx formats)
+_PHONE_RE = re.compile(
+    r"\b(?:"
+    r"(?:\+?\d{1,3}[-.\s]?)?\(?\d{3,4}\)?[-.\s]?\d{3,4}[-.\s]?\d{3,4}"
+    r"|0\d{3}[-.\s]?\d{7}"
+    r"|\+\d{1,3}[-.\s]?\d{3,4}[-.\s]?\d{3,4}[-.\s]?\d{3,4}"
+    r")\b"
+)
+_PHONE_SPOKEN_RE = re.compile(
+    r"(?:my\s+)?(?:phone|number|mobile|cell|contact)\s+(?:number\s+)?is\s+([\d\s+\-().x]+)",
+    re.IGNORECASE,
+)
+_WHITESPACE_RE = re.compile(r"\s+")
+_FIRST_NAME_RE = re.compile(r"(?:my\s+)?first\s+name\s+is\s+([A-Za-z]+)", re.IGNORECASE)
+_LAST_NAME_RE = re.compile(r"(?:my\s+)?last\s+name\s+is\s+([A-Za-z]+)", re.IGNORECASE)
+_NAME_RE = re.compile(r"(?:my\s+)?name\s+is\s+([A-Za-z]+(?:\s+[A-Za-z]+)*)", re.IGNORECASE)
+_EMAIL_SPOKEN_RE = re.compile(
+    r"email\s+is\s+([\w.+-]+\s*(?:at|@)\s*[\w-]+\s*(?:dot|\.)\s*\w+)",
+    re.IGNORECASE,
+)
+
+
+@lru_cache(maxsize=256)
 def _parse_llm_json(text: str) -> dict:
     """
     Parses JSON from LLM response text.
     Falls back to regex extraction if standard parsing fails.
 
+    Memoized: the LLM runs at temperature=0, so a resubmitted answer
+    yields the identical response text.  The returned dict is shared
+    between calls — read from it, never mutate it.
+
     Args:
         text: Raw response text from the LLM.
 
@@ -1121,20 +1626,22 @@ def _parse_llm_json(text: str) -> dict:
     # Strip markdown code fences if present
     cleaned = text.strip()
     if cleaned.startswith("```"):
-        cleaned = re.sub(r"^```(?:json)?\s*", "", cleaned)
-        cleaned = re.sub(r"\s*```$", "", cleaned)
+        cleaned = cleaned[7:] if cleaned.startswith("```json") else cleaned[3:]
+        cleaned = cleaned.lstrip()
+        if cleaned.endswith("```"):
+            cleaned = cleaned[:-3].rstrip()
 
     # Attempt 1: Direct JSON parse
     try:
-        return json.loads(cleaned)
+        return _loads_json(cleaned)
     except json.JSONDecodeError:
         pass
 
     # Attempt 2: Find JSON object in text via regex
-    json_match = re.search(r"\{[\s\S]*\}", cleaned)
+    json_match = _JSON_OBJECT_RE.search(cleaned)
     if json_match:
         try:
-            return json.loads(json_match.group())
+            return _loads_json(json_match.group())
         except json.JSONDecodeError:
             pass
 
@@ -1155,7 +1662,7 @@ def _regex_fallback_extract(transcript: str) -> dict:
     fields: dict = {}
 
     # Email pattern
-    email_match = re.search(r"[\w.+-]+@[\w-]+\.[\w.-]+", transcript)
+    email_match = _EMAIL_RE.search(transcript)
     if email_match:
         fields["email"] = {
             "value": email_match.group(),
@@ -1163,13 +1670,8 @@ def _regex_fallback_extract(transcript: str) -> dict:
             "source_text": email_match.group(),
         }
 
-    # Phone pattern (supports US, Pakistani 03xx-xxxxxxx, international +xx formats)
-    phone_match = re.search(
-        r"\b(?:"
-        r"(?:\+?\d{1,3}[-.\s]?)?\(?\d{3,4}\)?[-.\s]?\d{3,4}[-.\s]?\d{3,4}"
-        r"|0\d{3}[-.\s]?\d{7}"
-        r"|\+\d{1,3}[-.\s]?\d{3,4}[-.\s]?\d{3,4}[-.\s]?\d{3,4}"
-        r")\b", transcript)
+    # Phone pattern (US, Pakistani, international — see _PHONE_RE)
+    phone_match = _PHONE_RE.search(transcript)
     if phone_match:
         fields["phone"] = {
             "value": phone_match.group(),
@@ -1178,13 +1680,11 @@ def _regex_fallback_extract(transcript: str) -> dict:
         }
 
     # Phone spoken as "number is ..." or "phone is ..."
-    phone_spoken = re.search(
-        r"(?:my\s+)?(?:phone|number|mobile|cell|contact)\s+(?:number\s+)?is\s+([\d\s+\-().x]+)",
-        transcript, re.IGNORECASE)
+    phone_spoken = _PHONE_SPOKEN_RE.search(transcript)
     if phone_spoken and "phone" not in fields:
         raw_phone = phone_spoken.group(1).strip()
         # Clean up spoken separators
-        cleaned_phone = re.sub(r'\s+', '', raw_phone)
+        cleaned_phone = _WHITESPACE_RE.sub('', raw_phone)
         if len(cleaned_phone) >= 7:  # at least 7 digits
             fields["phone"] = {
                 "value": raw_phone,
@@ -1193,7 +1693,7 @@ def _regex_fallback_extract(transcript: str) -> dict:
             }
 
     # First name pattern
-    first_name_match = re.search(r"(?:my\s+)?first\s+name\s+is\s+([A-Za-z]+)", transcript, re.IGNORECASE)
+    first_name_match = _FIRST_NAME_RE.search(transcript)
     if first_name_match:
         fields["first_name"] = {
             "value": first_name_match.group(1).strip(),
@@ -1202,7 +1702,7 @@ def _regex_fallback_extract(transcript: str) -> dict:
         }
 
     # Last name pattern
-    last_name_match = re.search(r"(?:my\s+)?last\s+name\s+is\s+([A-Za-z]+)", transcript, re.IGNORECASE)
+    last_name_match = _LAST_NAME_RE.search(transcript)
     if last_name_match:
         fields["last_name"] = {
             "value": last_name_match.group(1).strip(),
@@ -1211,7 +1711,7 @@ def _regex_fallback_extract(transcript: str) -> dict:
         }
 
     # Name pattern ("my name is ..." or "name is ..." — handles any casing)
-    name_match = re.search(r"(?:my\s+)?name\s+is\s+([A-Za-z]+(?:\s+[A-Za-z]+)*)", transcript, re.IGNORECASE)
+    name_match = _NAME_RE.search(transcript)
     if name_match and "first_name" not in fields:
         fields["name"] = {
             "value": name_match.group(1).strip().title(),
@@ -1220,7 +1720,7 @@ def _regex_fallback_extract(transcript: str) -> dict:
         }
 
     # Email spoken as "email is ..." (with at/dot as words)
-    email_spoken = re.search(r"email\s+is\s+([\w.+-]+\s*(?:at|@)\s*[\w-]+\s*(?:dot|\.)\s*\w+)", transcript, re.IGNORECASE)
+    email_spoken = _EMAIL_SPOKEN_RE.search(transcript)
     if email_spoken and "email" not in fields:
         raw_email = email_spoken.group(1)
         cleaned = raw_email.replace(" at ", "@").replace("at ", "@").replace(" dot ", ".").replace("dot ", ".")
@@ -1234,11 +1734,62 @@ def _regex_fallback_extract(transcript: str) -> dict:
     return fields
 
 
+# Direct mappings for common field name variations (see _normalize_field_name)
+_FIELD_NAME_MAPPINGS: dict[str, str] = {
+    "fullname": "name",
+    "full_name": "name",
+    "full name": "name",
+    "firstname": "first_name",
+    "first name": "first_name",
+    "first": "first_name",
+    "fname": "first_name",
+    "given name": "first_name",
+    "givenname": "first_name",
+    "lastname": "last_name",
+    "last name": "last_name",
+    "last": "last_name",
+    "lname": "last_name",
+    "surname": "last_name",
+    "familyname": "last_name",
+    "family name": "last_name",
+    "emailaddress": "email",
+    "email_address": "email",
+    "email address": "email",
+    "e-mail": "email",
+    "mail": "email",
+    "phonenumber": "phone",
+    "phone_number": "phone",
+    "phone number": "phone",
+    "telephone": "phone",
+    "tel": "phone",
+    "mobile": "phone",
+    "cell": "phone",
+    "cellphone": "phone",
+    "streetaddress": "address",
+    "street_address": "address",
+    "street address": "address",
+    "address1": "address",
+    "addr": "address",
+    "zipcode": "zip",
+    "zip_code": "zip",
+    "zip code": "zip",
+    "postalcode": "zip",
+    "postal_code": "zip",
+    "postal code": "zip",
+    "postcode": "zip",
+    "organization": "company",
+    "org": "company",
+    "employer": "company",
+}
+
+
+@lru_cache(maxsize=1024)
 def _normalize_field_name(name: str) -> str:
     """
     Normalizes a field name to match against FIELD_SELECTORS keys.
 
     Handles variations like 'firstName' -> 'first_name', 'Full Name' -> 'name'.
+    Memoized — field names come from a small, repetitive vocabulary.
 
     Args:
         name: The raw field name from LLM extraction.
@@ -1248,63 +1799,174 @@ def _normalize_field_name(name: str) -> str:
     """
     lower = name.lower().strip()
 
-    # Direct mappings for common variations
-    mappings = {
-        "fullname": "name",
-        "full_name": "name",
-        "full name": "name",
-        "firstname": "first_name",
-        "first name": "first_name",
-        "first": "first_name",
-        "fname": "first_name",
-        "given name": "first_name",
-        "givenname": "first_name",
-        "lastname": "last_name",
-        "last name": "last_name",
-        "last": "last_name",
-        "lname": "last_name",
-        "surname": "last_name",
-        "familyname": "last_name",
-        "family name": "last_name",
-        "emailaddress": "email",
-        "email_address": "email",
-        "email address": "email",
-        "e-mail": "email",
-        "mail": "email",
-        "phonenumber": "phone",
-        "phone_number": "phone",
-        "phone number": "phone",
-        "telephone": "phone",
-        "tel": "phone",
-        "mobile": "phone",
-        "cell": "phone",
-        "cellphone": "phone",
-        "streetaddress": "address",
-        "street_address": "address",
-        "street address": "address",
-        "address1": "address",
-        "addr": "address",
-        "zipcode": "zip",
-        "zip_code": "zip",
-        "zip code": "zip",
-        "postalcode": "zip",
-        "postal_code": "zip",
-        "postal code": "zip",
-        "postcode": "zip",
-        "organization": "company",
-        "org": "company",
-        "employer": "company",
-    }
+    if lower in _FIELD_NAME_MAPPINGS:
+        return _FIELD_NAME_MAPPINGS[lower]
 
-    if lower in mappings:
-        return mappings[lower]
+    # Computed results are interned so the frozenset / dict membership
+    # tests in the matchers hit the identity fast path (mapping values
+    # are literals and already interned).
+    # Already lowercase — no camelCase boundary to split
+    if lower == name.strip():
+        return sys.intern(lower)
 
     # Convert camelCase to snake_case
-    snake = re.sub(r"([a-z])([A-Z])", r"\1_\2", name).lower()
-    if snake in mappings:
-        return mappings[snake]
+    snake = _CAMEL_RE.sub(r"\1_\2", name).lower()
+    if snake in _FIELD_NAME_MAPPINGS:
+        return _FIELD_NAME_MAPPINGS[snake]
+
+    return sys.intern(lower)
+
+
+class PageFieldView(TypedDict):
+    """Lowercased / tokenized attributes of one page field, built once per turn."""
+    id_l: str
+    name_l: str
+    placeholder_l: str
+    label_l: str
+    auto_l: str
+    aria_l: str
+    label_words: frozenset[str]
+    placeholder_words: frozenset[str]
+    targets: tuple[str, ...]  # non-empty id / name / placeholder / label / aria
+    haystack: str  # targets joined by "\x00", for one-pass substring checks
+    ref: dict
+
+
+class FieldTerms(NamedTuple):
+    """Match terms derived from one extracted field name (see _field_terms)."""
+    raw_lower: str
+    normalized_name: str
+    name_words: frozenset[str]
+    search_terms: tuple[str, ...]
 
-    return lower
+
+def _page_field_view(
+    dom_id: str,
+    dom_name: str,
+    dom_placeholder: str,
+    dom_label: str,
+    dom_autocomplete: str = "",
+    dom_aria: str = "",
+    ref: Optional[dict] = None,
+) -> PageFieldView:
+    """Builds the PageFieldView consumed by _view_matches()."""
+    id_l = dom_id.lower()
+    name_l = dom_name.lower()
+    placeholder_l = dom_placeholder.lower()
+    label_l = dom_label.lower()
+    aria_l = dom_aria.lower()
+    targets = tuple(t for t in (id_l, name_l, placeholder_l, label_l, aria_l) if t)
+    return {
+        "id_l": id_l,
+        "name_l": name_l,
+        "placeholder_l": placeholder_l,
+        "label_l": label_l,
+        "auto_l": dom_autocomplete.lower(),
+        "aria_l": aria_l,
+        "label_words": frozenset(_SPLIT_RE.split(label_l)),
+        "placeholder_words": frozenset(_SPLIT_RE.split(placeholder_l)),
+        "targets": targets,
+        "haystack": "\x00".join(targets),
+        "ref": ref if ref is not None else {},
+    }
+
+
+def _precompute_dom_fields(page_fields: list[dict]) -> list[PageFieldView]:
+    """
+    Builds one PageFieldView per DOM field, in page order.
+
+    Done once per turn so the E × D matching loop compares against
+    pre-lowered / pre-split attributes instead of re-normalizing them.
+    """
+    return [
+        _page_field_view(
+            page_field.get("id", ""), page_field.get("name", ""),
+            page_field.get("placeholder", ""), page_field.get("label", ""),
+            page_field.get("autocomplete", ""), page_field.get("ariaLabel", ""),
+            ref=page_field,
+        )
+        for page_field in page_fields
+    ]
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class _TrigramIndex:
+    """
+    Character-trigram inverted index over a page's PageFieldViews.
+
+    Used to skip DOM fields that cannot pass _view_matches() by label /
+    substring matching (exact id / name / autocomplete matches come from
+    match_selectors_node's own index, not from here).  A field is only
+    ruled out when it shares no trigram with the extracted field's terms:
+    a substring of length ≥ 3 always shares its trigrams with the string
+    containing it, so the candidate set keeps every real match.  Fields
+    with a target shorter than 3 characters (which could sit inside a
+    search term without sharing a trigram) are always candidates.
+    """
+
+    def __init__(self, postings: dict[str, set[int]], always: set[int], size: int) -> None:
+        self.postings = postings
+        self.always = always
+        self.size = size
+
+    @classmethod
+    def build(cls, views: list[PageFieldView]) -> "_TrigramIndex":
+        postings: dict[str, set[int]] = {}
+        always: set[int] = set()
+        for i, view in enumerate(views):
+            for target in view["targets"]:
+                if len(target) < 3:
+                    always.add(i)
+                for gram in _trigrams(target):
+                    postings.setdefault(gram, set()).add(i)
+        return cls(postings, always, len(views))
+
+    def candidates(self, terms: "FieldTerms") -> Optional[list[int]]:
+        """
+        Returns the ids (in page order) of the fields that may match
+        `terms`, or None when the index can't narrow the scan.
+        """
+        # Label / placeholder word matching needs every name word present;
+        # with only short words there is nothing to key on.
+        long_words = [w for w in terms.name_words if len(w) >= 3]
+        if terms.name_words and not long_words:
+            return None
+        grams: set[str] = set()
+        for text in (*terms.search_terms, *long_words):
+            grams |= _trigrams(text)
+        ids = set(self.always)
+        for gram in grams:
+            ids |= self.postings.get(gram, set())
+        if len(ids) == self.size:
+            return None
+        return sorted(ids)
+
+
+@lru_cache(maxsize=1024)
+def _field_terms(raw_name: str, normalized_name: str) -> FieldTerms:
+    """
+    Derives the terms _view_matches() compares against every DOM field.
+
+    Computed once per extracted field (and memoized across turns) rather
+    than once per extracted field × DOM field pair.
+    """
+    raw_lower = raw_name.lower().strip()
+    name_words = frozenset(_SPLIT_RE.split(raw_lower)) - {""}
+    # Terms shorter than 3 characters are skipped to avoid false matches
+    search_terms = tuple(dict.fromkeys(
+        term for term in (
+            normalized_name,
+            normalized_name.replace("_", ""),
+            raw_lower,
+            raw_lower.replace("_", ""),
+            raw_lower.replace("-", ""),
+        )
+        if len(term) >= 3
+    ))
+    return FieldTerms(raw_lower, normalized_name, name_words, search_terms)
 
 
 def _fields_match(
@@ -1320,11 +1982,8 @@ def _fields_match(
     """
     Checks whether a DOM field matches an extracted field name.
 
-    Uses multi-strategy matching:
-    1. Exact match on name or id (case-insensitive)
-    2. Autocomplete attribute semantic matching
-    3. Substring containment matching
-    4. Label / placeholder text matching
+    Convenience wrapper around _view_matches() for a single DOM field;
+    match_selectors_node builds the views once per turn instead.
 
     Args:
         raw_name: Raw field name from LLM extraction.
@@ -1339,13 +1998,35 @@ def _fields_match(
     Returns:
         True if the DOM field appears to match the extracted field.
     """
-    raw_lower = raw_name.lower().strip()
-    dom_id_lower = dom_id.lower()
-    dom_name_lower = dom_name.lower()
-    dom_placeholder_lower = dom_placeholder.lower()
-    dom_label_lower = dom_label.lower()
-    dom_autocomplete_lower = dom_autocomplete.lower()
-    dom_aria_lower = dom_aria.lower()
+    view = _page_field_view(
+        dom_id, dom_name, dom_placeholder, dom_label, dom_autocomplete, dom_aria,
+    )
+    return _view_matches(_field_terms(raw_name, normalized_name), view)
+
+
+def _view_matches(terms: FieldTerms, view: PageFieldView) -> bool:
+    """
+    Checks whether a DOM field (as a PageFieldView) matches an extracted
+    field name.
+
+    Uses multi-strategy matching (cheapest first):
+    1. Exact match on name or id (case-insensitive)
+    2. Autocomplete attribute semantic matching
+    3. Label / placeholder text matching
+    4. Substring containment matching
+
+    Args:
+        terms: Precomputed terms of the extracted field (_field_terms).
+        view: Precomputed view of the DOM field.
+
+    Returns:
+        True if the DOM field appears to match the extracted field.
+    """
+    raw_lower = terms.raw_lower
+    normalized_name = terms.normalized_name
+    dom_id_lower = view["id_l"]
+    dom_name_lower = view["name_l"]
+    dom_autocomplete_lower = view["auto_l"]
 
     # --- Strategy 1: Exact match on DOM name or id ---
     if dom_name_lower and (dom_name_lower == raw_lower or dom_name_lower == normalized_name):
@@ -1354,70 +2035,37 @@ def _fields_match(
         return True
 
     # --- Strategy 2: Autocomplete semantic mapping ---
-    autocomplete_map = {
-        "given-name": {"first_name", "firstname", "fname", "first"},
-        "family-name": {"last_name", "lastname", "lname", "last", "surname"},
-        "name": {"name", "fullname", "full_name"},
-        "email": {"email", "emailaddress", "email_address"},
-        "tel": {"phone", "phonenumber", "phone_number", "telephone", "tel", "mobile"},
-        "street-address": {"address", "streetaddress", "street_address", "address1"},
-        "address-level2": {"city", "addresscity"},
-        "address-level1": {"state", "province", "addressstate"},
-        "postal-code": {"zip", "zipcode", "zip_code", "postalcode", "postal_code"},
-        "country-name": {"country", "addresscountry"},
-        "organization": {"company", "organization", "org"},
-        "username": {"username", "user", "login"},
-    }
 
-    if dom_autocomplete_lower in autocomplete_map:
-        if normalized_name in autocomplete_map[dom_autocomplete_lower]:
+    # (The reverse direction — field name → autocomplete value — is the
+    # same relation, so one lookup covers both.)
+    autocomplete_names = _AUTOCOMPLETE_FIELD_NAMES.get(dom_autocomplete_lower, ())
+    if normalized_name in autocomplete_names or raw_lower in autocomplete_names:
+        return True
+
+    # --- Strategy 3: Label / placeholder semantic words ---
+    # e.g., extracted "first_name" should match label "First Name".
+    # Runs before the substring scan: two set checks against the view's
+    # precomputed word sets.
+    name_words = terms.name_words
+    if name_words:
+        # If all words of the field name appear in label or placeholder
+        if name_words.issubset(view["label_words"]):
             return True
-        if raw_lower in autocomplete_map[dom_autocomplete_lower]:
+        if name_words.issubset(view["placeholder_words"]):
             return True
 
-    # Reverse: check if the field name maps to this autocomplete value
-    for auto_val, field_names in autocomplete_map.items():
-        if normalized_name in field_names or raw_lower in field_names:
-            if dom_autocomplete_lower == auto_val:
-                return True
-
-    # --- Strategy 3: Substring containment ---
-    search_terms = {
-        normalized_name,
-        normalized_name.replace("_", ""),
-        raw_lower,
-        raw_lower.replace("_", ""),
-        raw_lower.replace("-", ""),
-    }
-    # Remove empty strings
-    search_terms.discard("")
-
-    dom_targets = [
-        dom_id_lower, dom_name_lower,
-        dom_placeholder_lower, dom_label_lower,
-        dom_aria_lower,
-    ]
-
+    # --- Strategy 4: Substring containment ---
+    # "term in target" for every target at once: one search over the
+    # NUL-joined haystack (terms never contain NUL, so no match can span
+    # two attributes).  "target in term" still needs the per-target loop.
+    search_terms = terms.search_terms
+    haystack = view["haystack"]
     for term in search_terms:
-        if len(term) < 3:
-            continue  # Skip very short terms to avoid false matches
-        for target in dom_targets:
-            if not target:
-                continue
-            if term in target or target in term:
-                return True
-
-    # --- Strategy 4: Label / placeholder semantic words ---
-    # e.g., extracted "first_name" should match label "First Name"
-    name_words = set(re.split(r'[_\-\s]+', raw_lower))
-    name_words.discard("")
-    if len(name_words) >= 1:
-        label_words = set(re.split(r'[_\-\s]+', dom_label_lower))
-        placeholder_words = set(re.split(r'[_\-\s]+', dom_placeholder_lower))
-        # If all words of the field name appear in label or placeholder
-        if name_words and name_words.issubset(label_words):
-            return True
-        if name_words and name_words.issubset(placeholder_words):
+        if term in haystack:
             return True
+    for target in view["targets"]:
+        for term in search_terms:
+            if target in term:
+                return True
 
     return False
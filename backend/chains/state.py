@@ -5,7 +5,8 @@ Defines the TypedDict state object used by the LangGraph form filling chain.
 All nodes read from and write to this shared state.
 """
 
-from typing import TypedDict, Optional
+import operator
+from typing import Annotated, TypedDict, Optional
 
 
 class FieldData(TypedDict, total=False):
@@ -61,7 +62,9 @@ class WebSenseState(TypedDict, total=False):
         matched_selectors: Dict of field_name → CSS selectors.
         confidence_scores: Dict of field_name → float confidence.
         missing_fields: Field names that still need values.
-        conversation_history: Past turns for multi-turn memory.
+        conversation_history: Past turns for multi-turn memory.  Append-only —
+            nodes return just their new entries and the operator.add
+            reducer concatenates them onto the channel.
         turn_count: Number of turns completed.
         conversation_phase: Current phase of the conversation state machine.
         next_route: Internal routing decision for conditional edges.
@@ -90,7 +93,7 @@ class WebSenseState(TypedDict, total=False):
     missing_fields: list[str]
 
     # --- Conversation Memory ---
-    conversation_history: list[dict]
+    conversation_history: Annotated[list[dict], operator.add]
     turn_count: int
 
     # --- Orchestration (NEW — replaces old confirm/correction flags) ---
@@ -0,0 +1,23 @@
+"""
+gunicorn settings for the spaCy NLP server (Linux/macOS).
+
+    cd backend/nlp
+    gunicorn -c gunicorn.conf.py spacy_server:app
+
+preload_app loads the spaCy model once in the master; workers are
+fork()ed from it and share the model's pages copy-on-write.
+"""
+
+import os
+
+bind = os.getenv("SPACY_SERVER_BIND", "0.0.0.0:5001")
+preload_app = True
+
+# Each worker keeps its own page_hash / parse caches, so /navigate/prepare
+# and the /navigate calls that follow it must land on the same process:
+# stay at one worker unless clients always send page_elements.
+workers = int(os.getenv("SPACY_SERVER_WORKERS", "1"))
+
+# Request threads per worker, as with waitress (see SERVER_THREADS)
+worker_class = "gthread"
+threads = int(os.getenv("SPACY_SERVER_THREADS") or max(4, os.cpu_count() or 1))
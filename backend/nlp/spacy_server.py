@@ -4,18 +4,68 @@ Provides intelligent intent and entity extraction for voice commands
 """
 
 from flask import Flask, request, jsonify
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 import spacy
 from spacy.matcher import Matcher
 from spacy.tokens import Span
+from thinc.api import to_numpy
 import json
 import re
+import heapq
 import logging
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import Future
 from datetime import datetime
 from difflib import SequenceMatcher
 import random
+from functools import lru_cache
+import numpy as np
+
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:  # fall back to difflib.SequenceMatcher
+    fuzz = process = None
+
+try:
+    import ahocorasick
+except ImportError:  # fall back to one substring check per keyword
+    ahocorasick = None
+
+try:
+    import orjson
+except ImportError:  # fall back to Flask's stdlib json provider
+    orjson = None
+
+try:
+    from waitress import serve
+except ImportError:  # fall back to the Flask development server
+    serve = None
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that serializes jsonify() responses with orjson, straight to bytes"""
+
+    OPTIONS = (orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS) if orjson else 0
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=self.OPTIONS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, option=self.OPTIONS), mimetype=self.mimetype)
+
 
 app = Flask(__name__)
+if orjson is not None:
+    app.json = OrjsonProvider(app)
 CORS(app)
 
 # Setup logging
@@ -26,21 +76,74 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # Load spaCy model
+# Commands only need tokens, lemmas, POS tags and like_num, so the small
+# model is used for parsing and the dependency parser and NER are never
+# run (tagger, attribute_ruler and lemmatizer stay on — the rule
+# lemmatizer depends on the mapped POS).
+DISABLED_PIPES = ["parser", "ner"]
+
+# Opt-in GPU execution (needs cupy). Must be enabled before any model is
+# loaded; it pays off for the batched nlp.pipe paths (DocBatcher,
+# /batch-parse), which is where every parse ends up.
+if os.getenv('WEBSENSE_USE_GPU') == '1':
+    if spacy.prefer_gpu():
+        logger.info("✅ spaCy running on GPU")
+    else:
+        logger.warning("⚠️  WEBSENSE_USE_GPU=1 but no GPU/cupy available, using CPU")
+
 try:
-    nlp = spacy.load("en_core_web_md")
-    logger.info("✅ Loaded spaCy model: en_core_web_md")
+    nlp = spacy.load("en_core_web_sm", disable=DISABLED_PIPES)
+    logger.info("✅ Loaded spaCy model: en_core_web_sm")
 except:
-    logger.warning("⚠️  Could not load en_core_web_md, trying en_core_web_sm...")
+    logger.warning("⚠️  Could not load en_core_web_sm, trying en_core_web_md...")
     try:
-        nlp = spacy.load("en_core_web_sm")
-        logger.info("✅ Loaded spaCy model: en_core_web_sm")
+        nlp = spacy.load("en_core_web_md", disable=DISABLED_PIPES)
+        logger.info("✅ Loaded spaCy model: en_core_web_md")
     except:
         logger.error("❌ No spaCy model found. Please run: python -m spacy download en_core_web_sm")
         nlp = None
 
+# Word vectors for find_best_match's semantic fallback come from
+# en_core_web_md, loaded on first use. Only its tokenizer and vocab are
+# needed, so every pipeline component is excluded.
+VECTOR_MODEL_EXCLUDE = ["tok2vec", "tagger", "parser", "attribute_ruler", "lemmatizer", "ner", "senter"]
+
+_vectors_nlp = None
+_vectors_nlp_lock = threading.Lock()
+
+
+def get_vectors_nlp():
+    """
+    Return the pipeline used for similarity scoring, loading en_core_web_md
+    the first time it is needed. Falls back to the parsing model if the
+    medium model is not installed.
+    """
+    global _vectors_nlp
+    if _vectors_nlp is None:
+        with _vectors_nlp_lock:
+            if _vectors_nlp is None:
+                if nlp is not None and nlp.vocab.vectors_length:
+                    _vectors_nlp = nlp
+                else:
+                    try:
+                        _vectors_nlp = spacy.load("en_core_web_md", exclude=VECTOR_MODEL_EXCLUDE)
+                        logger.info("✅ Loaded word vectors: en_core_web_md")
+                    except:
+                        logger.warning("⚠️  en_core_web_md not available, using parser model for similarity")
+                        _vectors_nlp = nlp
+    return _vectors_nlp
+
+# Request threads for waitress. Parsing blocks in spaCy's Cython code with
+# the GIL released (and concurrent parses share DocBatcher batches), so
+# one thread per core lets requests overlap; keep at least 4 for I/O.
+SERVER_THREADS = max(4, os.cpu_count() or 1)
+
 # Initialize matcher for custom patterns
 matcher = Matcher(nlp.vocab) if nlp else None
 
+# match_id -> ("ACTION" | "TARGET", label), decoded once at startup
+MATCH_LABELS = {}
+
 # Define command patterns for voice navigation
 if matcher:
     # Action patterns (click, open, show, etc.)
@@ -76,28 +179,47 @@ if matcher:
     tab_pattern = [{"LOWER": {"IN": ["tab", "tabs", "window"]}}]
     
     # Register patterns
-    matcher.add("ACTION_CLICK", [click_pattern])
-    matcher.add("ACTION_SHOW", [show_pattern])
-    matcher.add("ACTION_SCROLL", [scroll_pattern])
-    matcher.add("ACTION_OPEN", [open_pattern])
-    matcher.add("ACTION_CLOSE", [close_pattern])
-    matcher.add("ACTION_ZOOM", [zoom_pattern])
-    matcher.add("TARGET_BUTTON", [button_pattern])
-    matcher.add("TARGET_LINK", [link_pattern])
-    matcher.add("TARGET_MENU", [menu_pattern])
-    matcher.add("TARGET_INPUT", [input_pattern])
-    matcher.add("TARGET_TAB", [tab_pattern])
+    command_patterns = {
+        "ACTION_CLICK": click_pattern,
+        "ACTION_SHOW": show_pattern,
+        "ACTION_SCROLL": scroll_pattern,
+        "ACTION_OPEN": open_pattern,
+        "ACTION_CLOSE": close_pattern,
+        "ACTION_ZOOM": zoom_pattern,
+        "TARGET_BUTTON": button_pattern,
+        "TARGET_LINK": link_pattern,
+        "TARGET_MENU": menu_pattern,
+        "TARGET_INPUT": input_pattern,
+        "TARGET_TAB": tab_pattern,
+    }
+    for match_name, pattern in command_patterns.items():
+        matcher.add(match_name, [pattern])
+        kind, label = match_name.split("_", 1)
+        MATCH_LABELS[nlp.vocab.strings.add(match_name)] = (kind, label.lower())
+
+
+def _word_pattern(words):
+    """One compiled alternation matching any of the words/phrases as whole words"""
+    return re.compile(r"\b(?:" + "|".join(map(re.escape, words)) + r")\b")
 
 
 class ConversationContext:
     """Remembers conversation like a human would"""
     
+    # Updated on every successful /navigate; fixed slots, no per-instance dict
+    __slots__ = ('last_action', 'last_target', 'last_descriptor', 'max_history', 'history')
+    
+    # References to previous element / repeats of the entire command
+    REFERENCE_RE = _word_pattern(['it', 'that', 'this', 'there'])
+    REPEAT_RE = _word_pattern(['again', 'same thing', 'repeat', 'once more'])
+    
     def __init__(self):
         self.last_action = None
         self.last_target = None
         self.last_descriptor = None
-        self.history = []
         self.max_history = 30
+        # Oldest entries drop off automatically once max_history is reached
+        self.history = deque(maxlen=self.max_history)
     
     def update(self, action, target, descriptor):
         """Update context with latest command"""
@@ -110,21 +232,18 @@ class ConversationContext:
             'descriptor': descriptor,
             'timestamp': datetime.now()
         })
-        # Keep only recent history
-        if len(self.history) > self.max_history:
-            self.history = self.history[-self.max_history:]
     
     def resolve_reference(self, text):
         """Handle "it", "that", "same thing", "click it again" """
         text_lower = text.lower()
         
         # References to previous element
-        if any(word in text_lower for word in ['it', 'that', 'this', 'there']):
+        if self.REFERENCE_RE.search(text_lower):
             if self.last_descriptor:
                 return self.last_descriptor
         
         # Repeat entire command
-        if any(phrase in text_lower for phrase in ['again', 'same thing', 'repeat', 'once more']):
+        if self.REPEAT_RE.search(text_lower):
             return {
                 'action': self.last_action,
                 'target': self.last_target,
@@ -138,6 +257,205 @@ class ConversationContext:
         self.__init__()
 
 
+def _keyword_index(groups):
+    """Map every keyword to the first group (in declaration order) listing it"""
+    index = {}
+    for name, keywords in groups.items():
+        for keyword in keywords:
+            index.setdefault(keyword, name)
+    return index
+
+
+def _keyword_rank(groups):
+    """Map every keyword to (position, name) of the first group listing it"""
+    rank = {}
+    for position, (name, keywords) in enumerate(groups.items()):
+        for keyword in keywords:
+            rank.setdefault(keyword, (position, name))
+    return rank
+
+
+def _first_hit(hits, rank):
+    """
+    Value of the earliest-declared entry with a keyword among hits, or None.
+
+    Equivalent to walking the groups in order and returning the first one
+    that shares a keyword with hits, but only loops over the (few) hits.
+    """
+    best = None
+    for keyword in hits:
+        entry = rank.get(keyword)
+        if entry is not None and (best is None or entry[0] < best[0]):
+            best = entry
+    return best[1] if best else None
+
+
+class DocBatcher:
+    """
+    Runs texts submitted from concurrent request threads through the
+    pipeline together.
+
+    The worker thread takes the first pending text, waits up to max_wait_s
+    for more (at most max_batch in total) and processes the whole batch
+    with a single nlp.pipe call, amortizing spaCy's per-call overhead
+    when requests arrive at the same time.
+    """
+
+    def __init__(self, nlp, max_batch=32, max_wait_s=0.003):
+        self.nlp = nlp
+        self.max_batch = max_batch
+        self.max_wait_s = max_wait_s
+        self._queue = queue.Queue()
+        self._worker = None
+        self._lock = threading.Lock()
+
+    def __call__(self, text):
+        """Process one text, blocking until its batch is done"""
+        future = Future()
+        self._ensure_worker()
+        self._queue.put((text, future))
+        return future.result()
+
+    def _ensure_worker(self):
+        if self._worker is None:
+            with self._lock:
+                if self._worker is None:
+                    self._worker = threading.Thread(target=self._run, name="spacy-doc-batcher", daemon=True)
+                    self._worker.start()
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.max_wait_s
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                try:
+                    if remaining > 0:
+                        batch.append(self._queue.get(timeout=remaining))
+                    else:
+                        batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                docs = list(self.nlp.pipe([text for text, _ in batch], batch_size=self.max_batch))
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+
+            for (_, future), doc in zip(batch, docs):
+                future.set_result(doc)
+
+
+class ElementIndex:
+    """
+    Per-page data find_best_match needs, computed once: lowercased element
+    texts, their word sets and (on first semantic lookup) their word
+    vectors, quantized to int8 with one float32 factor per row.
+
+    Built per request from page_elements, or once per page through
+    /navigate/prepare and reused via the page_indexes LRUCache.
+    """
+
+    def __init__(self, elements):
+        self.elements = elements
+        # element index -> lowercased text, skipping empty ones
+        self.candidates = {}
+        for idx, elem in enumerate(elements):
+            elem_text = elem.get('text', '').lower()
+            if elem_text:
+                self.candidates[idx] = elem_text
+        self.word_sets = {idx: set(text.split()) for idx, text in self.candidates.items()}
+        self.positions = list(self.candidates)
+        self._vectors = None
+        self._by_type = None
+        # lowercased phrase -> find_best_match result; voice clients resend
+        # the same command (retries, "click next" loops) on the same page
+        self.matches = LRUCache(max_size=256)
+
+    def __len__(self):
+        return len(self.elements)
+
+    def for_type(self, element_type):
+        """
+        ElementIndex of the elements with the given type, in page order.
+        Elements are bucketed by type in one pass on first use, and each
+        bucket's index is kept for later commands on the same page.
+        """
+        if self._by_type is None:
+            buckets = defaultdict(list)
+            for elem in self.elements:
+                buckets[elem.get('type')].append(elem)
+            self._by_type = {elem_type: ElementIndex(group) for elem_type, group in buckets.items()}
+        index = self._by_type.get(element_type)
+        return index if index is not None else ElementIndex([])
+
+    def vectors(self, parser):
+        """
+        (int8[N, dim] matrix, float32[N] row factors), one row per candidate.
+
+        Rows are quantized symmetrically (largest component -> 127), which is
+        a quarter of the float32 footprint and plenty of precision for
+        cosine ranking. The row factor folds the dequantization scale and
+        the row's L2 norm together, so cosine(row, u) is
+        (matrix[row] @ u) * factors[row] / |u|.
+        """
+        if self._vectors is None:
+            matrix = np.stack(parser.embed(list(self.candidates.values())))
+            peaks = np.abs(matrix).max(axis=1)
+            norms = np.linalg.norm(matrix, axis=1)
+            scales = np.where(peaks > 0, 127.0 / np.where(peaks > 0, peaks, 1.0), 1.0).astype(np.float32)
+            quantized = np.rint(matrix * scales[:, None]).astype(np.int8)
+            factors = np.where(norms > 0, 1.0 / (scales * np.where(norms > 0, norms, 1.0)), 0.0)
+            self._vectors = (quantized, factors.astype(np.float32))
+        return self._vectors
+
+    def cosine(self, parser, user_vec):
+        """Cosine similarity of user_vec against every candidate row"""
+        quantized, factors = self.vectors(parser)
+        user_norm = np.linalg.norm(user_vec)
+        if not user_norm:
+            return np.zeros(len(factors), dtype=np.float32)
+        # int8 rows are upcast against the float32 query; numpy has no int8
+        # GEMV, so the gain is the 4x smaller cached matrix
+        return (quantized @ user_vec) * factors / user_norm
+
+
+class LRUCache:
+    """Small thread-safe LRU mapping (page indexes, text embeddings)"""
+
+    def __init__(self, max_size=128):
+        self.max_size = max_size
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._items.get(key)
+            if value is not None:
+                self._items.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+
+def _build_keyword_automaton(keywords):
+    """Aho-Corasick automaton reporting every keyword found in a text, or None"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
 class CommandParser:
     """Intelligent command parser using spaCy NLP"""
     
@@ -217,9 +535,113 @@ class CommandParser:
         'thirty': 30, 'forty': 40, 'fifty': 50
     }
     
-    def __init__(self):
+    # Reverse lookups, built once instead of scanning the dicts per call
+    ACTION_BY_KEYWORD = _keyword_index(ACTION_INTENTS)
+    TARGET_BY_KEYWORD = _keyword_index(TARGETS)
+    DIRECTION_BY_KEYWORD = _keyword_index(DIRECTIONS)
+    
+    # keyword -> (declaration order, value) for the whole-text keyword scans
+    ACTION_RANK = _keyword_rank(ACTION_INTENTS)
+    TARGET_RANK = _keyword_rank(TARGETS)
+    DIRECTION_RANK = _keyword_rank(DIRECTIONS)
+    NUMBER_RANK = {word: (position, num) for position, (word, num) in enumerate(NUMBER_WORDS.items())}
+    
+    FILLER_WORDS = frozenset({'could', 'you', 'please', 'kindly', 'want', 'would', 'like',
+                              'need', 'the', 'a', 'an', 'this', 'that', 'just', 'go', 'ahead'})
+    
+    # Words that never count as part of a descriptor
+    DESCRIPTOR_STOPWORDS = (FILLER_WORDS | frozenset(ACTION_BY_KEYWORD)
+                            | frozenset(TARGET_BY_KEYWORD) | frozenset(DIRECTION_BY_KEYWORD))
+    
+    # Expanded confirmation words
+    YES_WORDS = ('yes', 'yep', 'yeah', 'yup', 'sure', 'okay', 'ok', 'affirmative', 
+                 'confirm', 'proceed', 'absolutely', 'definitely', 'correct', 'right',
+                 'go ahead', 'do it', 'please', 'exactly', 'uh huh', 'uhuh', 'yay')
+    NO_WORDS = ('no', 'nope', 'nah', 'never', "don't", 'cancel', 'negative', 
+                'abort', 'skip', 'pass', 'wrong', 'incorrect', 'stop', 'halt',
+                'not that', "don't do", 'wait', 'hold on', 'uh uh', 'uhuh', 'nay')
+    
+    CANCEL_KEYWORDS = ('cancel', 'stop', 'clear', 'remove', 'hide', 'nevermind',
+                       'never mind', 'forget', 'undo', 'dismiss', 'close this',
+                       'go back', 'exit', 'quit', 'deactivate', 'turn off')
+    
+    # Frequent short commands, parsed once at startup so parse() can answer
+    # them with a dict lookup instead of running the pipeline
+    FAST_COMMANDS = (
+        'yes', 'yeah', 'yep', 'ok', 'okay', 'sure', 'no', 'nope', 'cancel', 'stop',
+        'never mind', 'undo', 'help', 'hello', 'hi', 'thanks', 'thank you',
+        'scroll down', 'scroll up', 'scroll to top', 'scroll to bottom', 'stop scrolling',
+        'back', 'go back', 'forward', 'go forward', 'next', 'previous',
+        'refresh', 'reload', 'zoom in', 'zoom out', 'click it',
+        'show buttons', 'show links', 'show all buttons', 'show all links'
+    )
+    
+    CORRECTION_RE = _word_pattern(['no', 'not that', 'wrong', 'other', 'different',
+                                   'i meant', 'actually', 'instead', 'wait'])
+    
+    # Every keyword the extractors look for as a substring of the command
+    ALL_KEYWORDS = frozenset().union(*ACTION_INTENTS.values(), *TARGETS.values(),
+                                     *DIRECTIONS.values(), NUMBER_WORDS, YES_WORDS,
+                                     NO_WORDS, CANCEL_KEYWORDS)
+    
+    def __init__(self, cache_size=4096):
         self.nlp = nlp
         self.matcher = matcher
+        # Voice commands repeat a lot ("scroll down", "yes"), so parse
+        # results are memoized on the normalized text
+        self._parse_cached = lru_cache(maxsize=cache_size)(self._parse_normalized)
+        # Processed Docs of recent commands, for callers that need more than
+        # the parse() result (e.g. /navigate's element-reference branch)
+        self._doc_cached = lru_cache(maxsize=1024)(self._make_doc)
+        # Cache misses from concurrent requests share nlp.pipe batches
+        self._batcher = DocBatcher(
+            nlp,
+            max_batch=int(os.getenv('PARSE_BATCH_SIZE', '32')),
+            max_wait_s=float(os.getenv('PARSE_BATCH_WAIT_MS', '3')) / 1000,
+        ) if nlp else None
+        self._keyword_automaton = _build_keyword_automaton(self.ALL_KEYWORDS)
+        self._embeddings = LRUCache(max_size=int(os.getenv('EMBEDDING_CACHE_SIZE', '2048')))
+        self._fast_commands = {}
+        self.fast_hits = 0
+        if nlp:
+            docs = nlp.pipe(self.FAST_COMMANDS)
+            self._fast_commands = {
+                text: tuple(self._parse_doc(doc, text).items())
+                for text, doc in zip(self.FAST_COMMANDS, docs)
+            }
+    
+    def matched_labels(self, doc):
+        """
+        First action and target label the Matcher finds in the Doc, as
+        {"ACTION": "click", "TARGET": "button"}. The Matcher runs once per
+        Doc; extract_action and extract_target share the result.
+        """
+        labels = doc.user_data.get('matched_labels')
+        if labels is None:
+            labels = {}
+            for match_id, _, _ in (self.matcher(doc) if self.matcher else ()):
+                kind, label = MATCH_LABELS[match_id]
+                labels.setdefault(kind, label)
+            doc.user_data['matched_labels'] = labels
+        return labels
+    
+    def keyword_hits(self, doc):
+        """
+        Set of ALL_KEYWORDS occurring anywhere in the command text.
+        
+        The text is scanned once (a single Aho-Corasick pass when
+        pyahocorasick is installed) and the result is kept on the Doc, so
+        every extractor run on the same Doc shares it.
+        """
+        hits = doc.user_data.get('keyword_hits')
+        if hits is None:
+            text_lower = doc.text.lower()
+            if self._keyword_automaton is not None:
+                hits = frozenset(keyword for _, keyword in self._keyword_automaton.iter(text_lower))
+            else:
+                hits = frozenset(keyword for keyword in self.ALL_KEYWORDS if keyword in text_lower)
+            doc.user_data['keyword_hits'] = hits
+        return hits
     
     def extract_number(self, doc):
         """Extract numbers from text (both digits and words)"""
@@ -232,121 +654,59 @@ class CommandParser:
                     pass
         
         # Check for word numbers
-        text_lower = doc.text.lower()
-        for word, num in self.NUMBER_WORDS.items():
-            if word in text_lower:
-                return num
-        
-        return None
+        return _first_hit(self.keyword_hits(doc), self.NUMBER_RANK)
     
     def extract_action(self, doc):
         """Extract primary action/intent from command"""
         # Use matcher to find action patterns
-        matches = self.matcher(doc) if self.matcher else []
-        
-        action_matches = []
-        for match_id, start, end in matches:
-            match_name = nlp.vocab.strings[match_id]
-            if match_name.startswith("ACTION_"):
-                action_matches.append(match_name.replace("ACTION_", "").lower())
-        
-        if action_matches:
-            return action_matches[0]
+        action = self.matched_labels(doc).get("ACTION")
+        if action:
+            return action
         
         # Fallback: Check verb lemmas
         for token in doc:
             if token.pos_ == "VERB":
-                lemma = token.lemma_.lower()
-                for intent, verbs in self.ACTION_INTENTS.items():
-                    if lemma in verbs:
-                        return intent
-        
-        # Check entire text for keywords (more flexible)
-        text_lower = doc.text.lower()
-        for intent, keywords in self.ACTION_INTENTS.items():
-            for keyword in keywords:
-                if keyword in text_lower:
+                intent = self.ACTION_BY_KEYWORD.get(token.lemma_.lower())
+                if intent:
                     return intent
         
-        return None
+        # Check entire text for keywords (more flexible)
+        return _first_hit(self.keyword_hits(doc), self.ACTION_RANK)
     
     def extract_target(self, doc):
         """Extract target element type from command"""
         # Use matcher to find target patterns
-        matches = self.matcher(doc) if self.matcher else []
-        
-        target_matches = []
-        for match_id, start, end in matches:
-            match_name = nlp.vocab.strings[match_id]
-            if match_name.startswith("TARGET_"):
-                target_matches.append(match_name.replace("TARGET_", "").lower())
-        
-        if target_matches:
-            return target_matches[0]
+        target = self.matched_labels(doc).get("TARGET")
+        if target:
+            return target
         
         # Fallback: Check for target keywords in text
-        text_lower = doc.text.lower()
-        for target, keywords in self.TARGETS.items():
-            for keyword in keywords:
-                if keyword in text_lower:
-                    return target
-        
-        return None
+        return _first_hit(self.keyword_hits(doc), self.TARGET_RANK)
     
     def extract_direction(self, doc):
         """Extract direction or position modifier"""
-        text_lower = doc.text.lower()
-        for direction, keywords in self.DIRECTIONS.items():
-            for keyword in keywords:
-                if keyword in text_lower:
-                    return direction
-        return None
+        return _first_hit(self.keyword_hits(doc), self.DIRECTION_RANK)
     
     def extract_descriptor(self, doc):
         """Extract descriptive text (e.g., button name)"""
-        # Remove common filler words and action words
-        filler_words = {'could', 'you', 'please', 'kindly', 'want', 'would', 'like', 
-                       'need', 'the', 'a', 'an', 'this', 'that', 'just', 'go', 'ahead'}
-        
-        action_words = set()
-        for verbs in self.ACTION_INTENTS.values():
-            action_words.update(verbs)
-        
-        target_words = set()
-        for targets in self.TARGETS.values():
-            target_words.update(targets)
-        
-        direction_words = set()
-        for dirs in self.DIRECTIONS.values():
-            direction_words.update(dirs)
-        
-        # Extract meaningful nouns and adjectives
+        # Extract meaningful nouns and adjectives, skipping filler, action,
+        # target and direction words
         descriptors = []
         for token in doc:
-            if token.pos_ in ['NOUN', 'PROPN', 'ADJ'] and \
-               token.text.lower() not in filler_words and \
-               token.text.lower() not in action_words and \
-               token.text.lower() not in target_words and \
-               token.text.lower() not in direction_words:
-                descriptors.append(token.text.lower())
+            if token.pos_ in ['NOUN', 'PROPN', 'ADJ']:
+                word = token.lower_
+                if word not in self.DESCRIPTOR_STOPWORDS:
+                    descriptors.append(word)
         
         return ' '.join(descriptors) if descriptors else None
     
     def is_confirmation(self, doc):
         """Check if command is a yes/no confirmation"""
-        text_lower = doc.text.lower().strip()
-        
-        # Expanded confirmation words
-        yes_words = ['yes', 'yep', 'yeah', 'yup', 'sure', 'okay', 'ok', 'affirmative', 
-                     'confirm', 'proceed', 'absolutely', 'definitely', 'correct', 'right',
-                     'go ahead', 'do it', 'please', 'exactly', 'uh huh', 'uhuh', 'yay']
-        no_words = ['no', 'nope', 'nah', 'never', "don't", 'cancel', 'negative', 
-                    'abort', 'skip', 'pass', 'wrong', 'incorrect', 'stop', 'halt',
-                    'not that', "don't do", 'wait', 'hold on', 'uh uh', 'uhuh', 'nay']
+        hits = self.keyword_hits(doc)
         
         # Check for explicit yes/no
-        has_yes = any(word in text_lower for word in yes_words)
-        has_no = any(word in text_lower for word in no_words)
+        has_yes = not hits.isdisjoint(self.YES_WORDS)
+        has_no = not hits.isdisjoint(self.NO_WORDS)
         
         if has_yes and not has_no:
             return 'yes'
@@ -357,13 +717,7 @@ class CommandParser:
     
     def extract_cancel_command(self, doc):
         """Detect cancel/stop/clear commands"""
-        text_lower = doc.text.lower().strip()
-        
-        cancel_keywords = ['cancel', 'stop', 'clear', 'remove', 'hide', 'nevermind',
-                          'never mind', 'forget', 'undo', 'dismiss', 'close this',
-                          'go back', 'exit', 'quit', 'deactivate', 'turn off']
-        
-        return any(keyword in text_lower for keyword in cancel_keywords)
+        return not self.keyword_hits(doc).isdisjoint(self.CANCEL_KEYWORDS)
     
     def is_question(self, text):
         """Is user asking a question?"""
@@ -373,56 +727,95 @@ class CommandParser:
     
     def is_correction(self, text):
         """Is user correcting previous command?"""
-        corrections = ['no', 'not that', 'wrong', 'other', 'different', 
-                      'i meant', 'actually', 'instead', 'wait']
-        return any(word in text.lower() for word in corrections)
+        return bool(self.CORRECTION_RE.search(text.lower()))
     
     def find_best_match(self, user_text, elements):
-        """Match what user said to actual elements on page using multiple strategies"""
+        """
+        Match what user said to actual elements on page using multiple strategies
+        
+        elements may be the page_elements list or a prebuilt ElementIndex;
+        results on a prebuilt index are remembered per phrase.
+        """
         if not user_text or not elements:
             return None, 0.0
         
+        user_lower = user_text.lower()
+        if not isinstance(elements, ElementIndex):
+            return self._match(user_lower, ElementIndex(elements))
+        
+        result = elements.matches.get(user_lower)
+        if result is None:
+            result = self._match(user_lower, elements)
+            elements.matches.put(user_lower, result)
+        return result
+    
+    def _match(self, user_lower, index):
+        """Uncached find_best_match of a lowercased phrase against an ElementIndex"""
+        candidates = index.candidates
+        
         best_idx = None
         best_score = 0.0
         
-        user_lower = user_text.lower()
+        user_words = set(user_lower.split())
         
-        for idx, elem in enumerate(elements):
-            elem_text = elem.get('text', '').lower()
-            
-            if not elem_text:
-                continue
-            
-            # Strategy 1: Perfect substring match (highest priority)
+        # Strategy 1: Perfect substring match (highest priority)
+        for idx, elem_text in candidates.items():
             if user_lower in elem_text or elem_text in user_lower:
                 return idx, 1.0
-            
-            # Strategy 2: Word overlap scoring
-            user_words = set(user_lower.split())
-            elem_words = set(elem_text.split())
-            if user_words and elem_words:
-                overlap = len(user_words & elem_words) / len(user_words)
-                if overlap > best_score:
-                    best_score = overlap
-                    best_idx = idx
-            
-            # Strategy 3: Character similarity (fuzzy matching)
-            similarity = SequenceMatcher(None, user_lower, elem_text).ratio()
-            if similarity > best_score:
-                best_score = similarity
-                best_idx = idx
-            
-            # Strategy 4: spaCy semantic similarity (if available)
-            if self.nlp:
-                try:
-                    doc1 = self.nlp(user_lower)
-                    doc2 = self.nlp(elem_text)
-                    semantic = doc1.similarity(doc2)
-                    if semantic > best_score:
-                        best_score = semantic
+        
+        # Strategy 2: Word overlap scoring
+        if user_words:
+            for idx, elem_words in index.word_sets.items():
+                if elem_words:
+                    overlap = len(user_words & elem_words) / len(user_words)
+                    if overlap > best_score:
+                        best_score = overlap
                         best_idx = idx
-                except:
-                    pass
+        
+        # Strategy 3: Character similarity (fuzzy matching)
+        if candidates:
+            if process is not None:
+                # One native call scores every candidate over the index's
+                # precomputed texts; the cutoff lets it drop candidates that
+                # can no longer beat the word-overlap score early
+                result = process.extractOne(user_lower, candidates, scorer=fuzz.ratio,
+                                            processor=None, score_cutoff=best_score * 100)
+                if result is not None:
+                    _, similarity, idx = result
+                    similarity /= 100.0
+                    if similarity > best_score or (similarity and similarity == best_score and idx < best_idx):
+                        best_score = similarity
+                        best_idx = idx
+            else:
+                # Without rapidfuzz: one matcher for the phrase, and difflib's
+                # cheap upper bounds skip the full ratio() of candidates that
+                # cannot beat the current best
+                matcher = SequenceMatcher(None, user_lower)
+                for idx, elem_text in candidates.items():
+                    matcher.set_seq2(elem_text)
+                    if matcher.real_quick_ratio() <= best_score or matcher.quick_ratio() <= best_score:
+                        continue
+                    similarity = matcher.ratio()
+                    if similarity > best_score:
+                        best_score = similarity
+                        best_idx = idx
+        
+        # Strategy 4: spaCy semantic similarity (if available). Always
+        # scored: a higher semantic score overrides the cheaper strategies
+        if self.nlp and candidates:
+            try:
+                # Element vectors are embedded once per index; scoring every
+                # element is then a single matrix-vector product
+                user_vec = self.embed([user_lower])[0]
+                sims = index.cosine(self, user_vec)
+                pos = int(np.argmax(sims))
+                idx = index.positions[pos]
+                # Ties go to the earlier element, as with the other strategies
+                if sims[pos] > best_score or (best_idx is not None and sims[pos] == best_score and idx < best_idx):
+                    best_score = float(sims[pos])
+                    best_idx = idx
+            except:
+                pass
         
         # Only return if confident enough
         if best_score >= 0.5:
@@ -430,6 +823,55 @@ class CommandParser:
         
         return None, 0.0
     
+    def suggest(self, user_text, elements, limit=5):
+        """
+        Texts of the elements closest to what the user said, best first, for
+        "did you mean" prompts. Only the top `limit` are selected (heap), the
+        full candidate list is never sorted.
+        """
+        index = elements if isinstance(elements, ElementIndex) else ElementIndex(elements)
+        user_lower = user_text.lower()
+        if fuzz is not None:
+            score = lambda idx: fuzz.ratio(user_lower, index.candidates[idx])
+        else:
+            score = lambda idx: SequenceMatcher(None, user_lower, index.candidates[idx]).ratio()
+        return [index.elements[idx].get('text') for idx in heapq.nlargest(limit, index.candidates, key=score)]
+    
+    def embed(self, texts):
+        """
+        float32 vectors for texts, one per text, for similarity scoring.
+        
+        Users keep referring to the same elements with the same phrasings,
+        so vectors are kept in an LRU across requests; only the misses are
+        embedded, as one batch.
+        """
+        vectors = [self._embeddings.get(text) for text in texts]
+        missing = [text for text, vector in zip(texts, vectors) if vector is None]
+        if missing:
+            fresh = {}
+            for text, doc in zip(missing, self.vector_docs(missing)):
+                # to_numpy: vectors live on the GPU when WEBSENSE_USE_GPU is set
+                vector = to_numpy(doc.vector).astype(np.float32)
+                vector.flags.writeable = False
+                fresh[text] = vector
+                self._embeddings.put(text, vector)
+            vectors = [fresh[text] if vector is None else vector for text, vector in zip(texts, vectors)]
+        return vectors
+    
+    def vector_docs(self, texts):
+        """
+        Build Docs for similarity scoring only.
+
+        Models with static word vectors (en_core_web_md) only need the
+        tokenizer here, so the tagger/lemmatizer are skipped. Models without
+        vectors (en_core_web_sm) fall back to the full pipeline, whose
+        tok2vec tensors back Doc.similarity.
+        """
+        vectors_nlp = get_vectors_nlp()
+        if vectors_nlp.vocab.vectors_length:
+            return vectors_nlp.tokenizer.pipe(texts, batch_size=64)
+        return vectors_nlp.pipe(texts, batch_size=64)
+    
     def parse(self, text):
         """
         Parse voice command and extract structured information
@@ -452,8 +894,70 @@ class CommandParser:
                 'raw_text': text
             }
         
-        doc = self.nlp(text.lower())
+        normalized = text.strip().lower()
+        fast = self._fast_commands.get(normalized)
+        if fast is not None:
+            self.fast_hits += 1
+            result = dict(fast)
+        else:
+            result = dict(self._parse_cached(normalized))
+        result['raw_text'] = text
+        return result
+    
+    def _parse_normalized(self, normalized_text):
+        """Uncached parse of stripped, lowercased text, frozen into a tuple of items"""
+        return tuple(self._parse_doc(self._doc_cached(normalized_text), normalized_text).items())
+    
+    def _make_doc(self, normalized_text):
+        return self._batcher(normalized_text)
+    
+    def doc_for(self, text):
+        """Processed Doc of a command, shared with parse() and cached on the normalized text"""
+        return self._doc_cached(text.strip().lower())
+    
+    def cache_info(self):
+        """Hit/miss statistics of the parse() cache"""
+        return self._parse_cached.cache_info()
+    
+    def parse_many(self, texts, batch_size=64):
+        """
+        Parse several commands, running the spaCy pipeline over them as one
+        batch via nlp.pipe instead of one nlp() call per command.
+        
+        Commands are normalized like parse(): fast commands are answered
+        from the pre-parsed table, and each distinct remaining command is
+        piped once however often it repeats in the batch.
         
+        Returns:
+            list: One parse() result per text, in order
+        """
+        if not self.nlp:
+            return [self.parse(text) for text in texts]
+        
+        normalized = [text.strip().lower() for text in texts]
+        pending = list(dict.fromkeys(
+            norm for norm in normalized if norm not in self._fast_commands
+        ))
+        
+        # n_process=1: forking workers costs more than it saves on the
+        # handful of short commands a batch request carries
+        docs = self.nlp.pipe(pending, batch_size=batch_size, n_process=1)
+        parsed = {norm: self._parse_doc(doc, norm) for norm, doc in zip(pending, docs)}
+        
+        results = []
+        for text, norm in zip(texts, normalized):
+            fast = self._fast_commands.get(norm)
+            if fast is not None:
+                self.fast_hits += 1
+                result = dict(fast)
+            else:
+                result = dict(parsed[norm])
+            result['raw_text'] = text
+            results.append(result)
+        return results
+    
+    def _parse_doc(self, doc, text):
+        """Build the parse() result from an already processed (lowercased) Doc"""
         # Extract components
         action = self.extract_action(doc)
         target = self.extract_target(doc)
@@ -506,187 +1010,208 @@ class CommandParser:
         return result
 
 
+def _same(*templates):
+    """Templates that don't depend on an element/direction being known"""
+    return (templates, templates)
+
+
+# action -> (templates when the element (or, for scroll, the direction) is
+# known, templates otherwise). {text} / {direction} are filled in only for
+# the template that gets picked.
+_RESPONSE_TEMPLATES = {
+    'click': (
+        ("Clicking that for you", "Got it! Clicking now", "Pressing that button",
+         "Click activated!", "Clicking {text} now", "Done! Clicked it"),
+        ("Clicking that for you", "Got it! Clicking now", "Pressing that button",
+         "Click activated!", "Clicking!", "Done! Clicked it"),
+    ),
+    'scroll': (
+        ("Scrolling for you", "Scrolling {direction}", "Moving the page",
+         "Got it! Scrolling", "Here we go, scrolling!"),
+        ("Scrolling for you", "Scrolling now", "Moving the page",
+         "Got it! Scrolling", "Here we go, scrolling!"),
+    ),
+    'scroll_continuous': _same(
+        "Starting continuous scroll",
+        "Auto-scrolling now",
+        "Keeping it scrolling",
+        "Will keep scrolling"
+    ),
+    'stop_scroll': _same(
+        "Stopping scroll",
+        "Scroll stopped",
+        "Halting auto-scroll",
+        "Paused scrolling",
+        "Stopped",
+        "Halted",
+        "Scrolling paused",
+        "Auto-scroll stopped",
+        "Done scrolling",
+        "Scroll cancelled",
+        "Scrolling ended",
+        "No more scrolling",
+        "Froze the scroll",
+        "Ceased scrolling",
+        "Scroll halted"
+    ),
+    'show': (
+        ("Here you go! Showing {text}", "Found {text} for you", "Let me highlight {text}",
+         "Here's what I found", "Got it! Showing you now", "There you go!"),
+        ("Here it is!", "Found it!", "Highlighting that now",
+         "Here's what I found", "Got it! Showing you now", "There you go!"),
+    ),
+    'back': _same(
+        "Going back now",
+        "Taking you to the previous page",
+        "Heading back",
+        "Back we go!",
+        "Previous page coming up"
+    ),
+    'forward': _same(
+        "Moving forward",
+        "Next page!",
+        "Going ahead",
+        "Forward we go!",
+        "Taking you forward"
+    ),
+    'reload': _same(
+        "Refreshing the page for you",
+        "Reloading now",
+        "Updating the page",
+        "Fresh content coming up!",
+        "Refreshing!",
+        "Page reload in progress"
+    ),
+    'duplicate': _same(
+        "Duplicating this tab for you",
+        "Creating a copy",
+        "Cloning this tab",
+        "Making a duplicate tab",
+        "Tab copied!",
+        "Duplicate tab created"
+    ),
+    'fill': _same(
+        "Filling that in for you",
+        "Entering the text",
+        "Typing it up",
+        "Got it, filling now",
+        "Text entered!"
+    ),
+    'read': _same(
+        "Reading that aloud for you",
+        "Here's what it says",
+        "Let me read that",
+        "Reading now",
+        "Here's the content"
+    ),
+    'help': _same(
+        "I'm here to help! What do you need?",
+        "Happy to assist!",
+        "Let me guide you",
+        "Here's what I can do for you",
+        "How can I help you today?"
+    ),
+    'open': _same(
+        "Opening that for you",
+        "Launching now",
+        "Opening it up!",
+        "Here we go!",
+        "Opening!"
+    ),
+    'close': _same(
+        "Closing that",
+        "Shutting it down",
+        "Closed!",
+        "Done, closed it",
+        "All closed up"
+    ),
+    'navigate': _same(
+        "Taking you there",
+        "Navigating now",
+        "On my way!",
+        "Going there now",
+        "Navigation started!"
+    ),
+    'stop': _same("Stopping", "Paused", "Halted", "Stopped!"),
+    'undo': _same("Undoing that for you", "Going back", "Reverting", "Undo complete!"),
+    'find': _same("Searching for that", "Looking for it", "Finding it now", "Search in progress!"),
+    'cancel': _same("Cancelled!", "Okay, cancelling", "All clear!", "Cancelled that for you"),
+    'greet': _same(
+        "Hello! How can I help you?",
+        "Hi there! What would you like to do?",
+        "Hey! I'm ready to assist!",
+        "Greetings! What can I do for you?",
+        "Hello! Ready when you are!",
+        "Hi! Let me know what you need!"
+    ),
+    'thank': _same(
+        "You're welcome!",
+        "Happy to help!",
+        "My pleasure!",
+        "Anytime!",
+        "Glad I could help!",
+        "No problem at all!",
+        "You're very welcome!",
+        "Always here to help!"
+    ),
+    'confirm': _same(
+        "Got it!",
+        "Okay, confirmed!",
+        "Understood!",
+        "Perfect!",
+        "Alright, proceeding!",
+        "Confirmed!"
+    ),
+    'deny': _same(
+        "Okay, cancelling",
+        "No problem, cancelled",
+        "Got it, stopping",
+        "Understood, won't do that",
+        "Alright, skipping that"
+    )
+}
+
+# Scroll responses depend on the direction rather than the element
+_DIRECTION_RESPONSE_ACTIONS = frozenset({'scroll'})
+
+_DEFAULT_RESPONSES = ("Done!", "Okay!", "Got it!", "All set!", "There you go!", "Perfect!")
+
+
 def generate_human_response(action, element=None, direction=None):
     """Respond like a human assistant would"""
+    templates = _RESPONSE_TEMPLATES.get(action)
+    if templates is None:
+        return random.choice(_DEFAULT_RESPONSES)
     
-    responses = {
-        'click': [
-            f"Clicking {element.get('text')}" if element else "Clicking that",
-            f"Opening {element.get('text')}" if element else "Opening that",
-            "Got it!" if element else "Done",
-            "On it!" if element else "Okay",
-            "Done" if element else "Sure"
-        ],
-        'scroll': [
-            f"Scrolling {direction}" if direction else "Scrolling",
-            f"Moving {direction}" if direction else "Moving down",
-            f"Going {direction}" if direction else "Scrolling page",
-            "Showing you more" if direction else "Scrolling"
-        ],
-        'scroll_continuous': [
-            "Starting continuous scroll",
-            "Auto-scrolling now",
-            "Keeping it scrolling",
-            "Will keep scrolling"
-        ],
-        'stop_scroll': [
-            "Stopping scroll",
-            "Scroll stopped",
-            "Halting auto-scroll",
-            "Paused scrolling",
-            "Stopped",
-            "Halted",
-            "Scrolling paused",
-            "Auto-scroll stopped",
-            "Done scrolling",
-            "Scroll cancelled",
-            "Scrolling ended",
-            "No more scrolling",
-            "Froze the scroll",
-            "Ceased scrolling",
-            "Scroll halted"
-        ],
-        'show': [
-            f"Here you go! Showing {element.get('text')}" if element else "Here it is!",
-            f"Found {element.get('text')} for you" if element else "Found it!",
-            f"Let me highlight {element.get('text')}" if element else "Highlighting that now",
-            "Here's what I found",
-            "Got it! Showing you now",
-            "There you go!"
-        ],
-        'back': [
-            "Going back now",
-            "Taking you to the previous page",
-            "Heading back",
-            "Back we go!",
-            "Previous page coming up"
-        ],
-        'forward': [
-            "Moving forward",
-            "Next page!",
-            "Going ahead",
-            "Forward we go!",
-            "Taking you forward"
-        ],
-        'reload': [
-            "Refreshing the page for you",
-            "Reloading now",
-            "Updating the page",
-            "Fresh content coming up!",
-            "Refreshing!",
-            "Page reload in progress"
-        ],
-        'duplicate': [
-            "Duplicating this tab for you",
-            "Creating a copy",
-            "Cloning this tab",
-            "Making a duplicate tab",
-            "Tab copied!",
-            "Duplicate tab created"
-        ],
-        'fill': [
-            "Filling that in for you",
-            "Entering the text",
-            "Typing it up",
-            "Got it, filling now",
-            "Text entered!"
-        ],
-        'read': [
-            "Reading that aloud for you",
-            "Here's what it says",
-            "Let me read that",
-            "Reading now",
-            "Here's the content"
-        ],
-        'help': [
-            "I'm here to help! What do you need?",
-            "Happy to assist!",
-            "Let me guide you",
-            "Here's what I can do for you",
-            "How can I help you today?"
-        ],
-        'click': [
-            "Clicking that for you",
-            "Got it! Clicking now",
-            "Pressing that button",
-            "Click activated!",
-            f"Clicking {element.get('text')} now" if element else "Clicking!",
-            "Done! Clicked it"
-        ],
-        'scroll': [
-            "Scrolling for you",
-            f"Scrolling {direction if direction else 'down'}" if direction else "Scrolling now",
-            "Moving the page",
-            "Got it! Scrolling",
-            "Here we go, scrolling!"
-        ],
-        'open': [
-            "Opening that for you",
-            "Launching now",
-            "Opening it up!",
-            "Here we go!",
-            "Opening!"
-        ],
-        'close': [
-            "Closing that",
-            "Shutting it down",
-            "Closed!",
-            "Done, closed it",
-            "All closed up"
-        ],
-        'navigate': [
-            "Taking you there",
-            "Navigating now",
-            "On my way!",
-            "Going there now",
-            "Navigation started!"
-        ],
-        'stop': ["Stopping", "Paused", "Halted", "Stopped!"],
-        'undo': ["Undoing that for you", "Going back", "Reverting", "Undo complete!"],
-        'find': ["Searching for that", "Looking for it", "Finding it now", "Search in progress!"],
-        'cancel': ["Cancelled!", "Okay, cancelling", "All clear!", "Cancelled that for you"],
-        'greet': [
-            "Hello! How can I help you?",
-            "Hi there! What would you like to do?",
-            "Hey! I'm ready to assist!",
-            "Greetings! What can I do for you?",
-            "Hello! Ready when you are!",
-            "Hi! Let me know what you need!"
-        ],
-        'thank': [
-            "You're welcome!",
-            "Happy to help!",
-            "My pleasure!",
-            "Anytime!",
-            "Glad I could help!",
-            "No problem at all!",
-            "You're very welcome!",
-            "Always here to help!"
-        ],
-        'confirm': [
-            "Got it!",
-            "Okay, confirmed!",
-            "Understood!",
-            "Perfect!",
-            "Alright, proceeding!",
-            "Confirmed!"
-        ],
-        'deny': [
-            "Okay, cancelling",
-            "No problem, cancelled",
-            "Got it, stopping",
-            "Understood, won't do that",
-            "Alright, skipping that"
-        ]
-    }
-    
-    options = responses.get(action, ["Done!", "Okay!", "Got it!", "All set!", "There you go!", "Perfect!"])
-    return random.choice(options)
+    known = direction if action in _DIRECTION_RESPONSE_ACTIONS else element
+    template = random.choice(templates[0] if known else templates[1])
+    return template.format(text=element.get('text') if element else None, direction=direction)
 
 
 # Initialize parser and context
 parser = CommandParser()
 conversation_context = ConversationContext()
+page_indexes = LRUCache(max_size=int(os.getenv('PAGE_CACHE_SIZE', '128')))
+
+
+def element_index_for(elements):
+    """
+    ElementIndex for a page_elements list, reused across requests that send
+    an identical list. Returns a fresh uncached index for unhashable input.
+    """
+    try:
+        key = ('elements', hash(tuple(
+            (e.get('id'), e.get('selector'), e.get('text'), e.get('type')) for e in elements
+        )))
+    except (AttributeError, TypeError):
+        return ElementIndex(elements)
+    
+    page_index = page_indexes.get(key)
+    # Compare the lists too, so a hash collision can never serve another page
+    if page_index is None or page_index.elements != elements:
+        page_index = ElementIndex(elements)
+        page_indexes.put(key, page_index)
+    return page_index
 
 
 @app.route('/health', methods=['GET'])
@@ -751,6 +1276,20 @@ def parse_command():
         }), 500
 
 
+@app.route('/parse/cache_stats', methods=['GET'])
+def parse_cache_stats():
+    """Report parse cache usage, to help tune its size"""
+    info = parser.cache_info()
+    return jsonify({
+        'hits': info.hits,
+        'misses': info.misses,
+        'maxsize': info.maxsize,
+        'currsize': info.currsize,
+        'fast_hits': parser.fast_hits,
+        'fast_commands': len(parser.FAST_COMMANDS)
+    })
+
+
 @app.route('/batch-parse', methods=['POST'])
 def batch_parse():
     """
@@ -778,10 +1317,7 @@ def batch_parse():
                 'error': '"commands" must be an array'
             }), 400
         
-        results = []
-        for cmd in commands:
-            if cmd and cmd.strip():
-                results.append(parser.parse(cmd))
+        results = parser.parse_many([cmd for cmd in commands if cmd and cmd.strip()])
         
         return jsonify({
             'success': True,
@@ -795,6 +1331,45 @@ def batch_parse():
         }), 500
 
 
+@app.route('/navigate/prepare', methods=['POST'])
+def navigate_prepare():
+    """
+    Index a page's elements once so /navigate calls can refer to them by hash
+    
+    Request body:
+        {
+            "page_hash": "3f9a...",
+            "page_elements": [{"id": 0, "text": "Sign In", "type": "button"}]
+        }
+    """
+    try:
+        data = request.get_json(cache=False)
+        
+        if not data or not data.get('page_hash') or not isinstance(data.get('page_elements'), list):
+            return jsonify({
+                'success': False,
+                'error': '"page_hash" and a "page_elements" array are required'
+            }), 400
+        
+        page_index = ElementIndex(data['page_elements'])
+        if parser.nlp and page_index.candidates:
+            # Embed now so the first command on the page doesn't pay for it
+            page_index.vectors(parser)
+        page_indexes.put(data['page_hash'], page_index)
+        
+        return jsonify({
+            'success': True,
+            'page_hash': data['page_hash'],
+            'element_count': len(page_index)
+        })
+    
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
 @app.route('/navigate', methods=['POST'])
 def navigate():
     """
@@ -805,9 +1380,13 @@ def navigate():
         "page_elements": [
             {"id": 0, "text": "Sign In", "type": "button", "selector": "#btn"},
             {"id": 1, "text": "Register", "type": "button"}
-        ]
+        ],
+        "page_hash": "optional client-side hash of page_elements"
     }
     
+    With a page_hash the element index is cached, so later commands on the
+    same page can send just the hash (see /navigate/prepare).
+    
     Response: {
         "success": true,
         "action": "click",
@@ -818,12 +1397,36 @@ def navigate():
     """
     
     try:
-        data = request.get_json()
+        # Parsed by app.json (orjson when installed) straight from the body
+        # bytes; cache=False keeps neither the raw body nor the parsed copy
+        # on the request
+        data = request.get_json(cache=False)
         command = data.get('command', '')
         elements = data.get('page_elements', [])
+        page_hash = data.get('page_hash')
         
         logger.info(f"Navigate command: {command}")
         
+        # Reuse the cached index of an already prepared page. Elements sent
+        # along with the hash win over a cached index that doesn't match them
+        page_index = None
+        if page_hash:
+            page_index = page_indexes.get(page_hash)
+            if page_index is None or (elements and page_index.elements != elements):
+                if not elements:
+                    return jsonify({
+                        'success': False,
+                        'needs_prepare': True,
+                        'error': 'Unknown page_hash, send page_elements or call /navigate/prepare first'
+                    }), 404
+                page_index = ElementIndex(elements)
+                page_indexes.put(page_hash, page_index)
+            elements = page_index.elements
+        elif elements:
+            # Clients without a page_hash usually resend the same page for
+            # several commands, so key the index on the elements themselves
+            page_index = element_index_for(elements)
+        
         # Check for correction
         if parser.is_correction(command):
             conversation_context.clear()
@@ -848,12 +1451,12 @@ def navigate():
             })
         elif reference:
             # "click it" - reference is descriptor
-            action = parser.extract_action(parser.nlp(command))
+            action = parser.extract_action(parser.doc_for(command))
             logger.info(f"Element reference: {reference}")
             
             # Try to match referenced descriptor
             if elements:
-                match_idx, confidence = parser.find_best_match(reference, elements)
+                match_idx, confidence = parser.find_best_match(reference, page_index or elements)
                 if match_idx is not None:
                     matched = elements[match_idx]
                     return jsonify({
@@ -892,8 +1495,14 @@ def navigate():
         if action and (descriptor or number is not None):
             # Filter by type if specified
             filtered = elements
+            filtered_index = page_index
             if target:
-                filtered = [e for e in elements if e.get('type') == target]
+                if page_index is not None:
+                    filtered_index = page_index.for_type(target)
+                    filtered = filtered_index.elements
+                else:
+                    filtered = [e for e in elements if e.get('type') == target]
+                    filtered_index = None
                 logger.info(f"Filtered to {len(filtered)} {target}s")
             
             # Handle number selection
@@ -924,7 +1533,7 @@ def navigate():
             
             # Text-based matching
             if descriptor:
-                match_idx, confidence = parser.find_best_match(descriptor, filtered)
+                match_idx, confidence = parser.find_best_match(descriptor, filtered_index or filtered)
                 
                 if match_idx is not None:
                     matched = filtered[match_idx]
@@ -945,7 +1554,7 @@ def navigate():
                     })
                 else:
                     # Couldn't find match - show options
-                    available = [e.get('text') for e in filtered[:5] if e.get('text')]
+                    available = parser.suggest(descriptor, filtered_index or filtered)
                     return jsonify({
                         'success': False,
                         'needs_clarification': True,
@@ -990,10 +1599,20 @@ if __name__ == '__main__':
     print("   POST /parse - Parse command structure")
     print("   POST /batch-parse - Parse multiple commands")
     print("   POST /navigate - Intelligent navigation with element matching")
+    print("   POST /navigate/prepare - Cache a page's elements by page_hash")
     print("\n💡 Test navigate endpoint:")
     print('   curl -X POST http://localhost:5001/navigate \\')
     print('     -H "Content-Type: application/json" \\')
     print('     -d \'{"command":"click login","page_elements":[{"id":0,"text":"Sign In","type":"button"}]}\'')
     print("\n")
     
-    app.run(host='0.0.0.0', port=5001, debug=True)
+    if serve:
+        # One process holding one copy of the model, with a thread pool for
+        # concurrent requests (spaCy releases the GIL in its Cython code)
+        threads = int(os.getenv('SPACY_SERVER_THREADS') or SERVER_THREADS)
+        print(f"🧵 Serving with waitress ({threads} threads)\n")
+        serve(app, host='0.0.0.0', port=5001, threads=threads)
+    else:
+        # The reloader re-imports the module (and reloads the model) on
+        # every change, so debug mode is opt-in
+        app.run(host='0.0.0.0', port=5001, debug=os.getenv('DEV') == '1')
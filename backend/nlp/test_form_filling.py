@@ -25,19 +25,25 @@ from chains.nodes import (
     router_node,
     review_node,
     fill_node,
+    match_selectors_node,
     confirm_handler_node,
     correction_handler_node,
     spell_readout_node,
     _build_label_map,
+    _pretty,
     _is_yes,
     _is_no,
     SENSITIVE_PATTERNS,
     _normalize_field_name,
     _fields_match,
     _parse_llm_json,
+    _JsonObjectTracker,
+    _field_context,
+    _redact_sensitive,
     CORRECTION_KEYWORDS,
 )
 from chains.graph import route_decision, confirm_decision, correction_decision
+from chains.checkpointer import DeferredCheckpointSaver
 
 
 # ================================================================
@@ -109,6 +115,26 @@ class TestIntakeNode:
         assert '4111' not in sanitized
         assert 'REDACTED' in sanitized or 'redacted' in sanitized.lower()
 
+    def test_overlapping_patterns_fully_redacted(self):
+        state: WebSenseState = {
+            'raw_transcript': 'password is 4111 1111 1111 1111',
+            'page_fields': [],
+            'session_id': 'sess_005b',
+        }
+        result = intake_node(state)
+        assert '1111' not in result['sanitized_transcript']
+        assert result['contains_sensitive'] is True
+
+    def test_non_ascii_digits_redacted(self):
+        state: WebSenseState = {
+            'raw_transcript': 'card ٤١١١ ١١١١ ١١١١ ١١١١',
+            'page_fields': [],
+            'session_id': 'sess_005c',
+        }
+        result = intake_node(state)
+        assert '[CREDIT_CARD_REDACTED]' in result['sanitized_transcript']
+        assert result['contains_sensitive'] is True
+
     def test_conversation_history_initialized(self):
         state: WebSenseState = {
             'raw_transcript': 'Hello world',
@@ -149,6 +175,25 @@ class TestHelpers:
         result = _parse_llm_json('not json at all')
         assert result == {}
 
+    def test_json_tracker_detects_object_end_across_chunks(self):
+        tracker = _JsonObjectTracker()
+        assert tracker.feed('```json\n{"a": "}\\"{"') is False
+        assert tracker.feed(', "b": {"c": 1}') is False
+        assert tracker.feed('}\n```') is True
+
+    def test_pretty_prefers_label_then_title_cases(self):
+        assert _pretty('fname', {'fname': 'First Name'}) == 'First Name'
+        assert _pretty('zip_code', {}) == 'Zip Code'
+        assert _pretty('billing--city', {'billing--city': 'billing--city'}) == 'Billing City'
+
+    def test_field_context_tracks_label_changes(self):
+        fields = [{'id': 'fname', 'name': 'fname', 'label': 'First Name'}]
+        context = _field_context(fields)
+        assert '"label_meaning":"First Name"' in context
+        assert _field_context([dict(fields[0])]) == context
+        relabelled = [{'id': 'fname', 'name': 'fname', 'placeholder': 'Given name'}]
+        assert '"label_meaning":"Given name"' in _field_context(relabelled)
+
     def test_correction_keywords_list(self):
         assert 'change' in CORRECTION_KEYWORDS
         assert 'fix' in CORRECTION_KEYWORDS
@@ -221,6 +266,67 @@ class TestFieldsMatch:
         ) is False
 
 
+# ================================================================
+# Selector Matching Tests
+# ================================================================
+class TestMatchSelectors:
+
+    def test_fallback_resolves_selector_alias(self):
+        state: WebSenseState = {
+            'extracted_fields': {'addressCity': {'value': 'Lahore', 'confidence': 0.9}},
+            'page_fields': [],
+        }
+        result = match_selectors_node(state)
+        assert '#city' in result['matched_selectors']['addressCity']
+
+    def test_no_extracted_fields(self):
+        result = match_selectors_node({'extracted_fields': {}, 'page_fields': [{'id': 'email'}]})
+        assert result == {'matched_selectors': {}, 'confidence_scores': {}}
+
+    def test_generic_fallback_skips_case_duplicates(self):
+        state: WebSenseState = {
+            'extracted_fields': {'favColor': {'value': 'blue', 'confidence': 0.9}},
+            'page_fields': [],
+        }
+        selectors = match_selectors_node(state)['matched_selectors']['favColor']
+        assert selectors[0] == "[name*='favColor' i]"
+        assert len(selectors) == len(set(s.lower() for s in selectors)) == 5
+
+    def test_exact_hit_keeps_label_matches(self):
+        """An exact id hit (e.g. a hidden #email) must not hide the field labelled "Email"."""
+        state: WebSenseState = {
+            'extracted_fields': {'email': {'value': 'a@b.co', 'confidence': 0.9}},
+            'page_fields': [
+                {'id': 'email', 'name': 'email', 'type': 'hidden', 'selector': '#email'},
+                {'id': 'input_3', 'name': 'q3', 'label': 'Email', 'selector': '#input_3'},
+            ],
+        }
+        selectors = match_selectors_node(state)['matched_selectors']['email']
+        assert selectors[:2] == ['#input_3', '#email']
+
+    def test_fuzzy_match_without_exact_hit(self):
+        state: WebSenseState = {
+            'extracted_fields': {'first_name': {'value': 'Yasir', 'confidence': 0.9}},
+            'page_fields': [{'id': 'input_7', 'name': 'q7', 'label': 'First Name', 'selector': '#input_7'}],
+        }
+        result = match_selectors_node(state)
+        assert result['matched_selectors']['first_name'][0] == '#input_7'
+
+    def test_fuzzy_match_on_long_form(self):
+        """Long forms go through the trigram prefilter; matches must survive it."""
+        page_fields = [
+            {'id': f'extra_{i}', 'name': f'extra_{i}', 'selector': f'#extra_{i}'}
+            for i in range(40)
+        ]
+        page_fields.append({'id': 'input_7', 'name': 'q', 'label': 'First Name', 'selector': '#input_7'})
+        state: WebSenseState = {
+            'extracted_fields': {'first_name': {'value': 'Yasir', 'confidence': 0.9}},
+            'page_fields': page_fields,
+        }
+        result = match_selectors_node(state)
+        assert result['matched_selectors']['first_name'] == ['#input_7', "[name='q']"]
+
+
 # ================================================================
 # Graph Routing Tests (new router-based architecture)
 # ================================================================
@@ -417,6 +523,87 @@ class TestConfirmHandler:
         assert result['bot_response']['action'] == 'ask_correction'
 
 
+# ================================================================
+# Correction Handler Tests
+# ================================================================
+class TestCorrectionHandler:
+
+    def test_bulk_correction_updates_all_mentioned_fields(self):
+        state: WebSenseState = {
+            'conversation_phase': 'correcting',
+            'raw_transcript': 'email is new@test.com and phone is 0300 1234567',
+            'extracted_fields': {
+                'email': {'value': 'old@test.com', 'confidence': 0.9},
+                'phoneNumber': {'value': '111', 'confidence': 0.9},
+            },
+            'page_fields': [],
+        }
+        result = correction_handler_node(state)
+        assert result['correction_route'] == 'review'
+        assert result['extracted_fields']['email']['value'] == 'new@test.com'
+        assert result['extracted_fields']['phoneNumber']['value'] == '0300 1234567'
+
+    def test_field_name_only_enters_spelling(self):
+        state: WebSenseState = {
+            'conversation_phase': 'correcting',
+            'raw_transcript': 'name is wrong',
+            'extracted_fields': {'name': {'value': 'Ahmed'}},
+            'page_fields': [],
+        }
+        result = correction_handler_node(state)
+        assert result['conversation_phase'] == 'spelling'
+        assert result['correcting_field_key'] == 'name'
+
+    @pytest.mark.parametrize('transcript, field_key', [
+        ('first name is not correct', 'first_name'),
+        ('the name is not right', 'name'),
+        ('name is misspelled', 'name'),
+        ('first name is the problem', 'first_name'),
+    ])
+    def test_judgement_phrasing_enters_spelling(self, transcript, field_key):
+        """Saying which field is wrong must not store the complaint as its value."""
+        state: WebSenseState = {
+            'conversation_phase': 'correcting',
+            'raw_transcript': transcript,
+            'extracted_fields': {field_key: {'value': 'Ahmed'}},
+            'page_fields': [],
+        }
+        result = correction_handler_node(state)
+        assert result['conversation_phase'] == 'spelling'
+        assert result['correcting_field_key'] == field_key
+        assert 'extracted_fields' not in result
+
+    def test_single_email_correction_applies_directly(self):
+        state: WebSenseState = {
+            'conversation_phase': 'correcting',
+            'raw_transcript': 'my email is new@test.com',
+            'extracted_fields': {'email': {'value': 'old@test.com', 'confidence': 0.9}},
+            'page_fields': [],
+        }
+        result = correction_handler_node(state)
+        assert result['correction_route'] == 'review'
+        assert result['extracted_fields']['email']['value'] == 'new@test.com'
+
+    def test_spell_confirm_yes_applies_spelling(self):
+        fields = {
+            'name': {'value': 'Ahmed', 'confidence': 0.8, 'source_text': 'my name is ahmed'},
+            'email': {'value': 'a@b.co', 'confidence': 0.9},
+        }
+        state: WebSenseState = {
+            'conversation_phase': 'spell_confirm',
+            'raw_transcript': 'yes',
+            'correcting_field_key': 'name',
+            'spelling_buffer': 'Ahmad ',
+            'extracted_fields': fields,
+            'page_fields': [],
+        }
+        result = correction_handler_node(state)
+        assert result['correction_route'] == 'review'
+        assert result['extracted_fields']['name']['value'] == 'Ahmad'
+        assert result['extracted_fields']['email'] is fields['email']
+        assert fields['name']['value'] == 'Ahmed'
+
+
 # ================================================================
 # Fill Node Tests
 # ================================================================
@@ -487,6 +674,194 @@ class TestSensitivePatterns:
         assert re.search(pattern, 'CVV is 4567')
         assert not re.search(pattern, 'cvv code')
 
+    def test_redaction_matches_ordered_substitution(self):
+        # Whatever scanner is installed (Hyperscan / RE2 / stdlib), the
+        # result must equal applying every pattern in order.
+        samples = [
+            'nothing to see here',
+            'my password is hunter2',
+            'password is 4111 1111 1111 1111',
+            'card 5500-0000-0000-0004 cvv is 123 ssn 123-45-6789',
+            'PASSWORD IS x and Password is y',
+            'cvv is 1234 5678 1234 5678',
+            'tab\tpassword is z',
+        ]
+        for text in samples:
+            expected = text
+            for data_type, pattern in SENSITIVE_PATTERNS.items():
+                expected = pattern.sub(f'[{data_type}_REDACTED]', expected)
+            sanitized, flagged = _redact_sensitive(text)
+            assert sanitized == expected
+            assert flagged is (expected != text)
+
+
+# ================================================================
+# Deferred Checkpointer Tests
+# ================================================================
+class TestDeferredCheckpointer:
+
+    def _run_turn(self, saver, transcript, thread_id):
+        from langgraph.graph import StateGraph, END
+        graph = StateGraph(WebSenseState)
+        graph.add_node('intake', intake_node)
+        graph.add_node('router', router_node)
+        graph.set_entry_point('intake')
+        graph.add_edge('intake', 'router')
+        graph.add_edge('router', END)
+        compiled = graph.compile(checkpointer=saver)
+        config = {'configurable': {'thread_id': thread_id}}
+        compiled.invoke({'raw_transcript': transcript, 'session_id': thread_id}, config)
+        return config
+
+    def test_nothing_persisted_before_flush(self):
+        saver = DeferredCheckpointSaver()
+        config = self._run_turn(saver, 'hello', 'ckpt_001')
+        assert saver.get_tuple(config) is None
+
+    def test_flush_persists_only_final_checkpoint(self):
+        saver = DeferredCheckpointSaver()
+        config = self._run_turn(saver, 'hello', 'ckpt_002')
+        saver.flush('ckpt_002')
+        saved = saver.get_tuple(config)
+        assert saved.checkpoint['channel_values']['turn_count'] == 1
+        assert saved.checkpoint['channel_values']['next_route'] == 'extract'
+        assert len(list(saver.list(config))) == 1
+
+    def test_flush_replaces_previous_turn(self):
+        from langgraph.checkpoint.sqlite import SqliteSaver
+        import sqlite3
+        for inner in (None, SqliteSaver(sqlite3.connect(':memory:', check_same_thread=False))):
+            saver = DeferredCheckpointSaver(inner)
+            for transcript in ('hello', 'my name is Yasir', 'thanks'):
+                config = self._run_turn(saver, transcript, 'ckpt_006')
+                saver.flush('ckpt_006')
+            history = list(saver.list(config))
+            assert len(history) == 1
+            values = saver.get_tuple(config).checkpoint['channel_values']
+            assert values['turn_count'] == 3
+            assert values['session_id'] == 'ckpt_006'
+
+    def test_least_recent_threads_evicted(self):
+        saver = DeferredCheckpointSaver(max_threads=2)
+        for thread_id in ('ckpt_007', 'ckpt_008', 'ckpt_007', 'ckpt_009'):
+            self._run_turn(saver, 'hello', thread_id)
+            saver.flush(thread_id)
+        kept = {t for t in ('ckpt_007', 'ckpt_008', 'ckpt_009')
+                if saver.get_tuple({'configurable': {'thread_id': t}})}
+        assert kept == {'ckpt_007', 'ckpt_009'}
+
+    def test_idle_threads_evicted(self, monkeypatch):
+        import chains.checkpointer as ckpt
+        clock = [100.0]
+        monkeypatch.setattr(ckpt.time, 'monotonic', lambda: clock[0])
+        saver = DeferredCheckpointSaver(idle_ttl=60)
+        self._run_turn(saver, 'hello', 'ckpt_010')
+        saver.flush('ckpt_010')
+        clock[0] += 61
+        self._run_turn(saver, 'hello', 'ckpt_011')
+        saver.flush('ckpt_011')
+        assert saver.get_tuple({'configurable': {'thread_id': 'ckpt_010'}}) is None
+        assert saver.get_tuple({'configurable': {'thread_id': 'ckpt_011'}})
+
+    def test_get_session_state_unknown_session(self):
+        from chains.graph import get_session_state
+        assert get_session_state('ckpt_missing') == {}
+
+    def test_worker_clear_session_op_deletes_checkpoints(self):
+        from chains.graph import invoke_form_filling, get_session_state
+        from chains.invoke_chain import handle_request
+        fields = [{'id': 'first_name', 'name': 'first_name', 'label': 'First Name', 'type': 'text'}]
+        invoke_form_filling('my first name is Yasir', fields, 'ckpt_005')
+        assert get_session_state('ckpt_005')
+        result = handle_request({'op': 'clear_session', 'session_id': 'ckpt_005'})
+        assert result == {'action': 'session_cleared', 'session_id': 'ckpt_005'}
+        assert get_session_state('ckpt_005') == {}
+
+    def test_worker_serves_turns_and_clear_on_one_process(self, monkeypatch, capsys):
+        import io
+        import json
+        from chains import invoke_chain
+        from chains.graph import get_session_state
+        fields = [{'id': 'first_name', 'name': 'first_name', 'label': 'First Name', 'type': 'text'}]
+        turn = {'transcript': 'my first name is Yasir', 'page_fields': fields, 'session_id': 'ckpt_006'}
+        lines = [{**turn, 'id': 1}, {**turn, 'id': 2},
+                 {'op': 'clear_session', 'session_id': 'ckpt_006', 'id': 3}]
+        stdin = io.TextIOWrapper(io.BytesIO(b''.join(json.dumps(l).encode() + b'\n' for l in lines)))
+        monkeypatch.setattr('sys.stdin', stdin)
+        invoke_chain.serve()
+        responses = [json.loads(l) for l in capsys.readouterr().out.splitlines()]
+        # Requests of one session run in order
+        assert [(r['id'], r.get('bot_response', r)['action']) for r in responses] == [
+            (1, 'confirm_fill'), (2, 'confirm_fill'), (3, 'session_cleared'),
+        ]
+        assert get_session_state('ckpt_006') == {}
+
+    def test_worker_runs_sessions_concurrently(self, monkeypatch, capsys):
+        import asyncio
+        import io
+        import json
+        from chains import invoke_chain
+
+        async def fake_ainvoke(transcript, session_id, **kwargs):
+            await asyncio.sleep(0.2 if session_id == 'slow' else 0)
+            return {'bot_response': {'action': 'speak', 'message': transcript}}
+
+        monkeypatch.setattr(invoke_chain, 'ainvoke_form_filling', fake_ainvoke)
+        lines = [
+            {'id': 'a', 'transcript': 'first', 'session_id': 'slow'},
+            {'id': 'b', 'transcript': 'second', 'session_id': 'fast'},
+            {'id': 'c', 'transcript': ''},
+        ]
+        stdin = io.TextIOWrapper(io.BytesIO(b''.join(json.dumps(l).encode() + b'\n' for l in lines)))
+        monkeypatch.setattr('sys.stdin', stdin)
+        invoke_chain.serve()
+        responses = [json.loads(l) for l in capsys.readouterr().out.splitlines()]
+        by_id = {r['id']: r for r in responses}
+        # The slow session does not hold up the others
+        assert responses[-1]['id'] == 'a'
+        assert by_id['a']['bot_response']['message'] == 'first'
+        assert by_id['b']['bot_response']['message'] == 'second'
+        assert by_id['c']['action'] == 'error'
+
+    def test_discard_drops_buffer(self):
+        saver = DeferredCheckpointSaver()
+        config = self._run_turn(saver, 'hello', 'ckpt_003')
+        saver.discard('ckpt_003')
+        saver.flush('ckpt_003')
+        assert saver.get_tuple(config) is None
+
+
+# ================================================================
+# Event Loop / LLM Client Tests
+# ================================================================
+class TestEventLoopReuse:
+
+    def test_llm_client_is_per_event_loop(self, monkeypatch):
+        import asyncio
+        from chains import nodes
+        monkeypatch.setattr(nodes, 'ChatCohere', lambda **kwargs: object())
+
+        async def get_twice():
+            return nodes._get_llm('m', 0), nodes._get_llm('m', 0)
+
+        first, same = asyncio.run(get_twice())
+        second, _ = asyncio.run(get_twice())
+        assert first is same
+        assert second is not first
+
+    def test_sync_invoke_reuses_one_open_loop(self, monkeypatch):
+        import asyncio
+        from chains import graph
+
+        async def fake_ainvoke(**kwargs):
+            return asyncio.get_running_loop()
+
+        monkeypatch.setattr(graph, 'ainvoke_form_filling', fake_ainvoke)
+        first = graph.invoke_form_filling('hi', [], 'loop_001')
+        second = graph.invoke_form_filling('hi', [], 'loop_001')
+        assert first is second
+        assert not first.is_closed()
+
 
 # ================================================================
 # Run
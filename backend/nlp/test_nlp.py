@@ -6,13 +6,18 @@ Runs test commands from test_commands.txt and shows parsing results
 import requests
 import json
 import sys
+from collections import defaultdict
 
 SPACY_SERVER = "http://localhost:5001"
 
+# One keep-alive connection for every request instead of a new TCP
+# connection per command
+_SESSION = requests.Session()
+
 def test_parse(text):
     """Test parsing a single command"""
     try:
-        response = requests.post(
+        response = _SESSION.post(
             f"{SPACY_SERVER}/parse",
             json={"text": text},
             timeout=5
@@ -29,29 +34,57 @@ def test_parse(text):
         return {"error": str(e)}
 
 
+def batch_parse(commands):
+    """Test parsing several commands with one /batch-parse request"""
+    try:
+        response = _SESSION.post(
+            f"{SPACY_SERVER}/batch-parse",
+            json={"commands": commands},
+            timeout=5 + len(commands) * 0.1
+        )
+        
+        if response.status_code == 200:
+            return response.json().get("results", [])
+        else:
+            error = {"error": f"HTTP {response.status_code}"}
+            
+    except requests.exceptions.ConnectionError:
+        error = {"error": "Cannot connect to spaCy server. Is it running?"}
+    except Exception as e:
+        error = {"error": str(e)}
+    return [error] * len(commands)
+
+
+_RULE = "=" * 70
+
+_RESULT_TEMPLATE = (
+    "🎯 Action:      {action}\n"
+    "🎪 Target:      {target}\n"
+    "➡️  Direction:   {direction}\n"
+    "🔢 Number:      {number}\n"
+    "📋 Descriptor:  {descriptor}\n"
+    "✅ Confirmation:{confirmation}\n"
+    "📊 Confidence:  {confidence:.0%}\n"
+)
+
+
 def print_result(text, result):
-    """Pretty print parsing result"""
-    print(f"\n{'='*70}")
-    print(f"📝 Command: \"{text}\"")
-    print(f"{'='*70}")
+    """Pretty print parsing result (one write per result)"""
+    header = f"\n{_RULE}\n📝 Command: \"{text}\"\n{_RULE}\n"
     
     if "error" in result:
-        print(f"❌ Error: {result['error']}")
+        sys.stdout.write(f"{header}❌ Error: {result['error']}\n")
         return
     
-    print(f"🎯 Action:      {result.get('action', 'None')}")
-    print(f"🎪 Target:      {result.get('target', 'None')}")
-    print(f"➡️  Direction:   {result.get('direction', 'None')}")
-    print(f"🔢 Number:      {result.get('number', 'None')}")
-    print(f"📋 Descriptor:  {result.get('descriptor', 'None')}")
-    print(f"✅ Confirmation:{result.get('confirmation', 'None')}")
-    print(f"📊 Confidence:  {result.get('confidence', 0):.0%}")
+    fields = defaultdict(lambda: 'None', result)
+    fields['confidence'] = result.get('confidence', 0)
+    sys.stdout.write(header + _RESULT_TEMPLATE.format_map(fields))
 
 
 def check_server_health():
     """Check if spaCy server is running"""
     try:
-        response = requests.get(f"{SPACY_SERVER}/health", timeout=3)
+        response = _SESSION.get(f"{SPACY_SERVER}/health", timeout=3)
         if response.status_code == 200:
             health = response.json()
             print("\n✅ spaCy Server Health Check:")
@@ -77,8 +110,10 @@ def run_test_file(filename="test_commands.txt"):
         
         stats = {"total": 0, "success": 0, "high_confidence": 0}
         
-        for cmd in commands:
-            result = test_parse(cmd)
+        # The whole file goes to the server in one request
+        results = batch_parse(commands)
+        
+        for cmd, result in zip(commands, results):
             stats["total"] += 1
             
             if "error" not in result:
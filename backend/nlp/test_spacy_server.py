@@ -0,0 +1,385 @@
+"""
+Test suite for the spaCy navigation server.
+
+Tests:
+  - find_best_match strategies (substring, overlap, fuzzy, semantic),
+    checked against the baseline one-element-at-a-time algorithm
+  - suggest ranking
+  - ElementIndex (int8 vectors, type buckets, per-phrase match cache)
+  - element_index_for / page_hash cache hits and misses
+  - DocBatcher, FAST_COMMANDS and parse_many
+  - /navigate/prepare → /navigate handshake (Flask test client)
+
+The spaCy models are not needed: similarity scoring runs on a blank
+English pipeline with a small hand-made word-vector table.
+
+Requires: pytest, spacy, flask, numpy
+Run:  pytest backend/nlp/test_spacy_server.py -v
+"""
+
+import os
+import sys
+import random
+import threading
+from difflib import SequenceMatcher
+
+import pytest
+
+pytest.importorskip('spacy')
+import numpy as np
+import spacy
+
+# ── Add the server module to path ──
+sys.path.insert(0, os.path.dirname(__file__))
+
+import spacy_server
+
+# Typo'd words have no vector; spaCy warns when it scores those as 0.0
+pytestmark = pytest.mark.filterwarnings('ignore:.*W008')
+
+
+VECTOR_WORDS = [
+    'sign', 'in', 'up', 'now', 'log', 'out', 'register', 'home', 'about',
+    'contact', 'us', 'next', 'page', 'submit', 'form', 'search', 'help',
+]
+
+
+def make_vectors_nlp(seed=0, dim=16, overrides=None):
+    """Blank English pipeline whose vocab carries random word vectors."""
+    rng = np.random.default_rng(seed)
+    vectors_nlp = spacy.blank('en')
+    vectors = {word: rng.normal(size=dim).astype(np.float32) for word in VECTOR_WORDS}
+    vectors.update(overrides or {})
+    for word, vector in vectors.items():
+        vectors_nlp.vocab.set_vector(word, vector)
+    return vectors_nlp, vectors
+
+
+@pytest.fixture
+def make_parser(monkeypatch):
+    """CommandParser whose semantic strategy scores with the given pipeline."""
+    def _make(vectors_nlp):
+        monkeypatch.setattr(spacy_server, '_vectors_nlp', vectors_nlp)
+        parser = spacy_server.CommandParser()
+        parser.nlp = vectors_nlp
+        return parser
+    return _make
+
+
+def baseline_find_best_match(nlp, user_text, elements, ratio=None):
+    """
+    The original find_best_match: every strategy scored element by element,
+    spaCy similarity included.  `ratio` replaces SequenceMatcher.ratio
+    when comparing against the RapidFuzz path.
+    """
+    if ratio is None:
+        ratio = lambda a, b: SequenceMatcher(None, a, b).ratio()
+    if not user_text or not elements:
+        return None, 0.0
+
+    best_idx = None
+    best_score = 0.0
+    user_lower = user_text.lower()
+
+    for idx, elem in enumerate(elements):
+        elem_text = elem.get('text', '').lower()
+        if not elem_text:
+            continue
+        if user_lower in elem_text or elem_text in user_lower:
+            return idx, 1.0
+        user_words = set(user_lower.split())
+        elem_words = set(elem_text.split())
+        if user_words and elem_words:
+            overlap = len(user_words & elem_words) / len(user_words)
+            if overlap > best_score:
+                best_score = overlap
+                best_idx = idx
+        similarity = ratio(user_lower, elem_text)
+        if similarity > best_score:
+            best_score = similarity
+            best_idx = idx
+        semantic = nlp(user_lower).similarity(nlp(elem_text))
+        if semantic > best_score:
+            best_score = semantic
+            best_idx = idx
+
+    if best_score >= 0.5:
+        return best_idx, best_score
+    return None, 0.0
+
+
+def random_page(rng, size):
+    """Element list with multi-word texts from VECTOR_WORDS (plus typos)."""
+    words = VECTOR_WORDS + ['sgn', 'regster', 'hme', 'nxt']
+    return [
+        {'id': i, 'text': ' '.join(rng.sample(words, rng.randint(1, 3))).title(),
+         'type': rng.choice(['button', 'link']), 'selector': f'#el{i}'}
+        for i in range(size)
+    ]
+
+
+def assert_same_match(got, expected):
+    """
+    Same element and score as the baseline.  The cached element vectors
+    are int8-quantized, so semantic scores may differ in the ~3rd decimal;
+    a different element is only accepted for such a near-tie.
+    """
+    if got[0] == expected[0]:
+        assert got[1] == pytest.approx(expected[1], abs=1e-2)
+    else:
+        assert got[1] == pytest.approx(expected[1], abs=1e-2), (got, expected)
+
+
+# ================================================================
+# find_best_match Tests
+# ================================================================
+class TestFindBestMatch:
+
+    def test_semantic_score_overrides_strong_fuzzy_match(self, make_parser):
+        """A higher similarity score wins even when the cheaper strategies scored >= 0.7."""
+        _, vectors = make_vectors_nlp()
+        register = (vectors['sign'] + vectors['up'] + vectors['now']) / 3
+        vectors_nlp, _ = make_vectors_nlp(overrides={'register': register})
+        parser = make_parser(vectors_nlp)
+        elements = [{'text': 'Sign in now'}, {'text': 'Register'}]
+
+        idx, confidence = parser.find_best_match('sign up now', elements)
+        assert idx == 1
+        assert confidence > 0.9
+
+    def test_first_substring_match_wins_over_later_exact_text(self, make_parser):
+        """As in the baseline scan, the first element in page order that
+        contains (or is contained in) the phrase is returned."""
+        parser = make_parser(make_vectors_nlp()[0])
+        elements = [{'text': 'Sign'}, {'text': 'Sign In'}]
+        assert parser.find_best_match('sign in', elements) == (0, 1.0)
+        index = spacy_server.ElementIndex(elements)
+        assert parser.find_best_match('Sign In', index) == (0, 1.0)
+
+    def test_no_confident_match(self, make_parser):
+        parser = make_parser(make_vectors_nlp()[0])
+        assert parser.find_best_match('zzz', [{'text': 'qqq'}]) == (None, 0.0)
+
+    @pytest.mark.parametrize('use_rapidfuzz', [False, True])
+    def test_matches_baseline_algorithm(self, make_parser, monkeypatch, use_rapidfuzz):
+        if use_rapidfuzz:
+            fuzz = pytest.importorskip('rapidfuzz').fuzz
+            ratio = lambda a, b: fuzz.ratio(a, b) / 100.0
+        else:
+            monkeypatch.setattr(spacy_server, 'fuzz', None)
+            monkeypatch.setattr(spacy_server, 'process', None)
+            ratio = None
+        vectors_nlp, _ = make_vectors_nlp(seed=1)
+        parser = make_parser(vectors_nlp)
+        rng = random.Random(7)
+        queries = ['sign in', 'log out', 'contact', 'regster now', 'nxt page',
+                   'help us', 'submit the form', 'search', 'home about']
+
+        for _ in range(60):
+            elements = random_page(rng, rng.randint(1, 12))
+            index = spacy_server.ElementIndex(elements)
+            for query in queries:
+                expected = baseline_find_best_match(vectors_nlp, query, elements, ratio)
+                assert_same_match(parser.find_best_match(query, elements), expected)
+                # Prebuilt index, first call and cached repeat
+                assert_same_match(parser.find_best_match(query, index), expected)
+                assert_same_match(parser.find_best_match(query, index), expected)
+
+    def test_type_bucket_matches_filtered_list(self, make_parser):
+        parser = make_parser(make_vectors_nlp(seed=2)[0])
+        rng = random.Random(3)
+        for _ in range(30):
+            elements = random_page(rng, 10)
+            buttons = [e for e in elements if e['type'] == 'button']
+            bucket = spacy_server.ElementIndex(elements).for_type('button')
+            assert bucket.elements == buttons
+            for query in ('sign in', 'contact us', 'nxt'):
+                assert parser.find_best_match(query, bucket) == parser.find_best_match(query, buttons)
+        assert len(spacy_server.ElementIndex(elements).for_type('menu')) == 0
+
+    def test_match_cache_is_per_index(self, make_parser):
+        parser = make_parser(make_vectors_nlp()[0])
+        first = spacy_server.ElementIndex([{'text': 'Home'}, {'text': 'Sign In'}])
+        second = spacy_server.ElementIndex([{'text': 'Sign In'}, {'text': 'Home'}])
+        assert parser.find_best_match('sign in', first) == (1, 1.0)
+        assert parser.find_best_match('sign in', second) == (0, 1.0)
+        assert first.matches.get('sign in') == (1, 1.0)
+
+
+# ================================================================
+# suggest Tests
+# ================================================================
+class TestSuggest:
+
+    def test_top_five_by_similarity_in_page_order_on_ties(self, make_parser, monkeypatch):
+        monkeypatch.setattr(spacy_server, 'fuzz', None)
+        parser = make_parser(make_vectors_nlp()[0])
+        rng = random.Random(5)
+        for _ in range(30):
+            elements = random_page(rng, rng.randint(0, 12)) + [{'text': ''}]
+            texts = [e['text'] for e in elements if e['text']]
+            expected = sorted(
+                texts, key=lambda t: SequenceMatcher(None, 'sign up', t.lower()).ratio(), reverse=True,
+            )[:5]
+            assert parser.suggest('sign up', elements) == expected
+
+
+# ================================================================
+# ElementIndex Tests
+# ================================================================
+class TestElementIndex:
+
+    def test_int8_cosine_close_to_float_cosine(self, make_parser):
+        vectors_nlp, _ = make_vectors_nlp(seed=4)
+        parser = make_parser(vectors_nlp)
+        elements = random_page(random.Random(1), 12)
+        index = spacy_server.ElementIndex(elements)
+        user_vec = vectors_nlp('sign in now').vector
+        expected = [vectors_nlp('sign in now').similarity(vectors_nlp(e['text'].lower())) for e in elements]
+        assert index.cosine(parser, user_vec) == pytest.approx(expected, abs=1e-2)
+        quantized, _ = index.vectors(parser)
+        assert quantized.dtype == np.int8
+
+    def test_empty_texts_are_skipped(self):
+        index = spacy_server.ElementIndex([{'text': ''}, {'text': 'Go'}, {}])
+        assert index.candidates == {1: 'go'}
+        assert index.positions == [1]
+        assert len(index) == 3
+
+
+# ================================================================
+# Page Cache Tests
+# ================================================================
+class TestElementIndexFor:
+
+    @pytest.fixture(autouse=True)
+    def fresh_cache(self, monkeypatch):
+        monkeypatch.setattr(spacy_server, 'page_indexes', spacy_server.LRUCache(max_size=8))
+
+    def test_identical_list_hits_cache(self):
+        elements = [{'id': 0, 'text': 'Sign In', 'type': 'button', 'selector': '#a'}]
+        first = spacy_server.element_index_for(elements)
+        assert spacy_server.element_index_for([dict(e) for e in elements]) is first
+
+    @pytest.mark.parametrize('change', [
+        lambda e: e[0].update(text='Register'),
+        lambda e: e[0].update(selector='#b'),
+        lambda e: e[0].update(href='/other'),
+        lambda e: e.append({'id': 1, 'text': 'Home'}),
+    ])
+    def test_changed_list_misses_cache(self, change):
+        elements = [{'id': 0, 'text': 'Sign In', 'type': 'button', 'selector': '#a'}]
+        first = spacy_server.element_index_for(elements)
+        changed = [dict(e) for e in elements]
+        change(changed)
+        index = spacy_server.element_index_for(changed)
+        assert index is not first
+        assert index.elements == changed
+
+    def test_unhashable_elements_get_fresh_index(self):
+        elements = [{'id': [0], 'text': 'Sign In'}]
+        assert spacy_server.element_index_for(elements) is not spacy_server.element_index_for(elements)
+
+    def test_lru_evicts_oldest(self):
+        cache = spacy_server.LRUCache(max_size=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+        assert cache.get('b') is None
+        assert cache.get('a') == 1 and cache.get('c') == 3
+
+
+# ================================================================
+# Parsing Pipeline Tests
+# ================================================================
+class TestParsing:
+
+    @pytest.fixture
+    def blank_parser(self, monkeypatch):
+        blank = spacy.blank('en')
+        monkeypatch.setattr(spacy_server, 'nlp', blank)
+        return spacy_server.CommandParser()
+
+    def test_doc_batcher_returns_each_callers_doc(self):
+        batcher = spacy_server.DocBatcher(spacy.blank('en'), max_batch=8, max_wait_s=0.01)
+        texts = [f'click item {i}' for i in range(20)]
+        results = [None] * len(texts)
+
+        def run(i):
+            results[i] = batcher(texts[i]).text
+
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(len(texts))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert results == texts
+
+    def test_fast_commands_match_full_parse(self, blank_parser):
+        for command in blank_parser.FAST_COMMANDS:
+            fast = blank_parser.parse(command)
+            full = dict(blank_parser._parse_normalized(command))
+            full['raw_text'] = command
+            assert fast == full
+        assert blank_parser.fast_hits == len(blank_parser.FAST_COMMANDS)
+
+    def test_parse_many_matches_parse(self, blank_parser):
+        commands = ['Scroll Down', 'click sign in', '  click sign in ', 'show links', 'yes', 'show links']
+        assert blank_parser.parse_many(commands) == [blank_parser.parse(c) for c in commands]
+
+
+# ================================================================
+# /navigate Endpoint Tests
+# ================================================================
+class TestNavigateEndpoint:
+
+    PAGE = [
+        {'id': 0, 'text': 'Home', 'type': 'link', 'selector': '#home'},
+        {'id': 1, 'text': 'Sign In', 'type': 'button', 'selector': '#signin'},
+    ]
+
+    @pytest.fixture
+    def client(self, monkeypatch, make_parser):
+        parser = make_parser(make_vectors_nlp()[0])
+        monkeypatch.setattr(parser, 'parse', lambda command: {
+            'action': 'click', 'target': None, 'descriptor': command.split(' ', 1)[1],
+            'direction': None, 'number': None, 'raw_text': command,
+        })
+        monkeypatch.setattr(spacy_server, 'parser', parser)
+        monkeypatch.setattr(spacy_server, 'conversation_context', spacy_server.ConversationContext())
+        monkeypatch.setattr(spacy_server, 'page_indexes', spacy_server.LRUCache(max_size=8))
+        return spacy_server.app.test_client()
+
+    def test_prepare_then_navigate_by_hash(self, client):
+        prepared = client.post('/navigate/prepare', json={'page_hash': 'p1', 'page_elements': self.PAGE})
+        assert prepared.get_json() == {'success': True, 'page_hash': 'p1', 'element_count': 2}
+
+        response = client.post('/navigate', json={'command': 'click sign in', 'page_hash': 'p1'})
+        matched = response.get_json()['matched_element']
+        assert matched['selector'] == '#signin'
+
+    def test_unknown_hash_without_elements_needs_prepare(self, client):
+        response = client.post('/navigate', json={'command': 'click sign in', 'page_hash': 'nope'})
+        assert response.status_code == 404
+        assert response.get_json()['needs_prepare'] is True
+
+    def test_unknown_hash_with_elements_is_indexed(self, client):
+        client.post('/navigate', json={'command': 'click home', 'page_hash': 'p2', 'page_elements': self.PAGE})
+        response = client.post('/navigate', json={'command': 'click home', 'page_hash': 'p2'})
+        assert response.get_json()['matched_element']['selector'] == '#home'
+
+    def test_sent_elements_override_stale_hash(self, client):
+        client.post('/navigate/prepare', json={'page_hash': 'p3', 'page_elements': self.PAGE})
+        changed = [dict(self.PAGE[1], selector='#signin-v2'), dict(self.PAGE[0])]
+        response = client.post('/navigate', json={
+            'command': 'click sign in', 'page_hash': 'p3', 'page_elements': changed,
+        })
+        assert response.get_json()['matched_element']['selector'] == '#signin-v2'
+
+    def test_navigate_without_hash_uses_sent_elements(self, client):
+        response = client.post('/navigate', json={'command': 'click sign in', 'page_elements': self.PAGE})
+        assert response.get_json()['matched_element']['selector'] == '#signin'
+        changed = [dict(self.PAGE[0]), dict(self.PAGE[1], selector='#other')]
+        response = client.post('/navigate', json={'command': 'click sign in', 'page_elements': changed})
+        assert response.get_json()['matched_element']['selector'] == '#other'
@@ -39,7 +39,7 @@ const RATE_LIMIT_MAX = 30; // 30 requests per minute per session
 
 // In-memory rate limiting tracker (use Redis in production)
 const rateLimitStore = new Map();
-// In-memory conversation state tracker for spawned Python processes
+// In-memory conversation state tracker for the Python chain worker
 const sessionStateStore = new Map();
 
 // ============================================================
@@ -146,63 +146,149 @@ function rateLimit(req, res, next) {
 // HELPER FUNCTIONS
 // ============================================================
 
+// Long-lived Python chain worker (invoke_chain.py in stdin mode).
+// Requests are written as newline-delimited JSON tagged with an id; the
+// worker runs them concurrently and echoes the id in each response, so
+// pending requests are kept in a Map keyed by id.
+let chainWorker = null;
+let chainWorkerBuffer = '';
+let nextChainRequestId = 1;
+const pendingChainRequests = new Map();
+
 /**
- * Invokes the Python LangGraph chain via child_process.
- * 
- * @param {Object} payload - Data to send to the Python chain.
- * @returns {Promise<Object>} Chain response.
+ * Rejects every in-flight request and stops the worker.
+ * The next request spawns a fresh worker.
+ *
+ * @param {Error} error - Reason passed to the pending requests.
  */
-async function invokePythonChain(payload) {
-  return new Promise((resolve, reject) => {
-    const startTime = Date.now();
-    let stdout = '';
-    let stderr = '';
+function resetChainWorker(error) {
+  const worker = chainWorker;
+  chainWorker = null;
+  chainWorkerBuffer = '';
+
+  for (const pending of pendingChainRequests.values()) {
+    clearTimeout(pending.timeout);
+    pending.reject(error);
+  }
+  pendingChainRequests.clear();
 
-    const pythonProcess = spawn(PYTHON_EXECUTABLE, [
-      CHAIN_SCRIPT_PATH,
-      JSON.stringify(payload),
-    ]);
+  if (worker && worker.exitCode === null) {
+    worker.kill();
+  }
+}
 
-    pythonProcess.stdout.on('data', (data) => {
-      stdout += data.toString();
+/**
+ * Resolves the pending request a line of worker output answers.
+ *
+ * @param {string} line - One JSON response line from the worker.
+ */
+function handleChainWorkerLine(line) {
+  let result;
+  try {
+    result = JSON.parse(line);
+  } catch (err) {
+    logger.error('Failed to parse Python chain output', {
+      error: err.message,
+      stdout: line.substring(0, 500),
     });
+    return;
+  }
 
-    pythonProcess.stderr.on('data', (data) => {
-      stderr += data.toString();
-    });
+  const pending = pendingChainRequests.get(result.id);
+  if (!pending) {
+    // Answer to a request that already timed out, or untagged output
+    logger.warn('Unexpected output from Python chain worker');
+    return;
+  }
+  pendingChainRequests.delete(result.id);
+  clearTimeout(pending.timeout);
+  delete result.id;
+  const duration = Date.now() - pending.startTime;
+
+  // Request-level failures (bad payload, missing fields) come back as a
+  // bare error response rather than a BotResponse envelope.
+  if (result.action === 'error' && !result.bot_response) {
+    logger.error('Python chain execution failed', { duration });
+    return pending.reject(new Error(result.message || 'Python chain execution failed'));
+  }
 
-    pythonProcess.on('close', (code) => {
-      const duration = Date.now() - startTime;
+  logger.debug('Python chain completed', { duration, status: result.status });
+  pending.resolve(result);
+}
 
-      if (code !== 0) {
-        logger.error('Python chain execution failed', {
-          code,
-          stderr: stderr.substring(0, 500), // Limit error log size
-          duration,
-        });
-        return reject(new Error(`Python process exited with code ${code}`));
-      }
+/**
+ * Returns the running chain worker, spawning it on first use.
+ *
+ * @returns {ChildProcess} The worker process.
+ */
+function getChainWorker() {
+  if (chainWorker) {
+    return chainWorker;
+  }
 
-      try {
-        const result = JSON.parse(stdout);
-        logger.debug('Python chain completed', { duration, status: result.status });
-        resolve(result);
-      } catch (err) {
-        logger.error('Failed to parse Python chain output', {
-          error: err.message,
-          stdout: stdout.substring(0, 500),
-        });
-        reject(new Error('Invalid JSON response from Python chain'));
+  const worker = spawn(PYTHON_EXECUTABLE, [CHAIN_SCRIPT_PATH]);
+  chainWorker = worker;
+
+  worker.stdout.on('data', (data) => {
+    if (worker !== chainWorker) return;
+    chainWorkerBuffer += data.toString();
+    let newline = chainWorkerBuffer.indexOf('\n');
+    while (newline !== -1) {
+      const line = chainWorkerBuffer.slice(0, newline);
+      chainWorkerBuffer = chainWorkerBuffer.slice(newline + 1);
+      if (line.trim()) {
+        handleChainWorkerLine(line);
       }
+      newline = chainWorkerBuffer.indexOf('\n');
+    }
+  });
+
+  worker.stderr.on('data', (data) => {
+    logger.error('Python chain worker stderr', {
+      stderr: data.toString().substring(0, 500), // Limit error log size
     });
+  });
+
+  worker.on('error', (err) => {
+    if (worker !== chainWorker) return;
+    logger.error('Python chain worker failed to start', { error: err.message });
+    resetChainWorker(new Error('Python chain worker failed to start'));
+  });
+
+  worker.on('close', (code) => {
+    if (worker !== chainWorker) return;
+    logger.error('Python chain worker exited', { code });
+    resetChainWorker(new Error(`Python process exited with code ${code}`));
+  });
 
-    // Timeout handler
-    const timeout = setTimeout(() => {
-      pythonProcess.kill();
-      reject(new Error('Python chain execution timeout'));
-    }, REQUEST_TIMEOUT);
+  return worker;
+}
+
+/**
+ * Invokes the Python LangGraph chain via the long-lived worker process.
+ * 
+ * @param {Object} payload - Data to send to the Python chain.
+ * @returns {Promise<Object>} Chain response.
+ */
+async function invokePythonChain(payload) {
+  return new Promise((resolve, reject) => {
+    const worker = getChainWorker();
+    const id = nextChainRequestId++;
+
+    // Timed from when the request is sent.  Responses are matched by id,
+    // so a stuck request only fails itself; the worker and the other
+    // in-flight requests carry on.
+    pendingChainRequests.set(id, {
+      resolve,
+      reject,
+      startTime: Date.now(),
+      timeout: setTimeout(() => {
+        pendingChainRequests.delete(id);
+        reject(new Error('Python chain execution timeout'));
+      }, REQUEST_TIMEOUT),
+    });
 
-    pythonProcess.on('close', () => clearTimeout(timeout));
+    worker.stdin.write(JSON.stringify({ ...payload, id }) + '\n');
   });
 }
 
@@ -388,7 +474,8 @@ router.post('/form-fill/correction', httpsOnly, authenticate, rateLimit, async (
 /**
  * DELETE /api/form-fill/session/:sessionId
  * 
- * Clears LangGraph MemorySaver state for a session.
+ * Clears the session's LangGraph checkpoints in the chain worker, plus
+ * the rate limit and resume state kept here.
  * Called when tab closes or user resets.
  * 
  * Response:
@@ -412,9 +499,9 @@ router.delete('/form-fill/session/:sessionId', httpsOnly, authenticate, async (r
     rateLimitStore.delete(sessionId);
     sessionStateStore.delete(sessionId);
 
-    // Note: MemorySaver clears automatically on process restart.
-    // For production, implement persistent storage (SqliteSaver)
-    // and add actual deletion logic here.
+    // The worker outlives sessions, so its checkpoints must be deleted
+    // explicitly — otherwise a reused sessionId resumes the old phase
+    await invokePythonChain({ op: 'clear_session', session_id: sessionId });
 
     logger.info('Session cleared', { sessionId });
     const duration = Date.now() - startTime;
@@ -168,6 +168,49 @@ router.get('/nlp-health', async (req, res) => {
   }
 });
 
+/**
+ * Cache a page's elements on the spaCy server under a page hash
+ * POST /api/voice/navigate/prepare
+ * Body: { "page_hash": "3f9a...", "page_elements": [...] }
+ */
+router.post('/navigate/prepare', async (req, res) => {
+  try {
+    const { page_hash, page_elements } = req.body;
+
+    if (!page_hash || !Array.isArray(page_elements)) {
+      return res.status(400).json({
+        success: false,
+        error: 'Missing "page_hash" or "page_elements" field'
+      });
+    }
+
+    const response = await axios.post(`${SPACY_SERVER_URL}/navigate/prepare`, {
+      page_hash,
+      page_elements
+    }, {
+      timeout: 5000,
+      headers: {
+        'Content-Type': 'application/json'
+      }
+    });
+
+    return res.json(response.data);
+
+  } catch (error) {
+    console.error('Error in navigate/prepare:', error.message);
+
+    if (error.response) {
+      return res.status(error.response.status).json(error.response.data);
+    }
+
+    return res.status(503).json({
+      success: false,
+      error: 'NLP service unavailable',
+      message: error.message
+    });
+  }
+});
+
 /**
  * Intelligent navigation with element matching
  * POST /api/voice/navigate
@@ -175,12 +218,13 @@ router.get('/nlp-health', async (req, res) => {
  *   "command": "click login button",
  *   "page_elements": [
  *     {"id": 0, "text": "Sign In", "type": "button", "selector": "#btn"}
- *   ]
+ *   ],
+ *   "page_hash": "optional; lets later commands omit page_elements"
  * }
  */
 router.post('/navigate', async (req, res) => {
   try {
-    const { command, page_elements } = req.body;
+    const { command, page_elements, page_hash } = req.body;
 
     if (!command || !command.trim()) {
       return res.status(400).json({
@@ -192,7 +236,8 @@ router.post('/navigate', async (req, res) => {
     // Call spaCy server navigate endpoint
     const response = await axios.post(`${SPACY_SERVER_URL}/navigate`, {
       command: command.trim(),
-      page_elements: page_elements || []
+      page_elements: page_elements || [],
+      page_hash
     }, {
       timeout: 5000,
       headers: {